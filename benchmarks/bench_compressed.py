@@ -0,0 +1,116 @@
+"""
+Memory and access-latency benchmark for compressed quote text.
+
+Builds a synthetic corpus from the bundled quotes, then compares the plain
+list-of-dicts ``QuoteGenerator.quotes`` with ``compress_text=True``.
+
+Usage:
+    python -m benchmarks.bench_compressed [--quotes N] [--accesses N]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from quotes_generator import QuoteGenerator
+
+
+def make_corpus(path: str, count: int, seed: int = 0) -> None:
+    """
+    Write a synthetic quotes file.
+
+    Each quote reshuffles the words of a bundled quote, so vocabulary and
+    length distribution are realistic but texts are not exact duplicates.
+
+    Args:
+        path: Output file path.
+        count: Number of quotes.
+        seed: Random seed.
+    """
+    rng = random.Random(seed)
+    base = QuoteGenerator().quotes
+    quotes = []
+    for _ in range(count):
+        quote = rng.choice(base)
+        words = quote["text"].split()
+        rng.shuffle(words)
+        quotes.append({"text": " ".join(words), "author": quote["author"], "category": quote["category"]})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"quotes": quotes}, f)
+
+
+def measure(path: str, accesses: int, compress_text: bool) -> dict:
+    """
+    Load a corpus and time text access.
+
+    Args:
+        path: Quotes file.
+        accesses: Number of text reads per access pattern.
+        compress_text: Whether to enable compressed storage.
+
+    Returns:
+        Dictionary with memory and latency figures.
+    """
+    gc.collect()
+    tracemalloc.start()
+    generator = QuoteGenerator(path, compress_text=compress_text)
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    quotes = generator.quotes
+    rng = random.Random(1)
+    positions = [rng.randrange(len(quotes)) for _ in range(accesses)]
+
+    start = time.perf_counter()
+    for idx in positions:
+        quotes[idx]["text"]
+    random_ns = (time.perf_counter() - start) / accesses * 1e9
+
+    start = time.perf_counter()
+    for idx in range(min(accesses, len(quotes))):
+        quotes[idx]["text"]
+    sequential_ns = (time.perf_counter() - start) / min(accesses, len(quotes)) * 1e9
+
+    return {"memory": memory, "random_ns": random_ns, "sequential_ns": sequential_ns,
+            "store": generator.text_store.stats() if generator.text_store else None}
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quotes", type=int, default=100000, help="Corpus size")
+    parser.add_argument("--accesses", type=int, default=100000, help="Reads per pattern")
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        make_corpus(path, args.quotes)
+        plain = measure(path, args.accesses, compress_text=False)
+        packed = measure(path, args.accesses, compress_text=True)
+    finally:
+        os.unlink(path)
+
+    print(f"{args.quotes:,} quotes\n")
+    print(f"{'storage':<12}  {'memory':>10}  {'random read':>12}  {'sequential read':>16}")
+    for name, result in (("plain", plain), ("compressed", packed)):
+        print(
+            f"{name:<12}  {result['memory'] / 2**20:>8.1f}MB  "
+            f"{result['random_ns']:>10.0f}ns  {result['sequential_ns']:>14.0f}ns"
+        )
+    store = packed["store"]
+    print(
+        f"\nText: {store['raw_bytes'] / 2**20:.1f}MB raw -> "
+        f"{store['compressed_bytes'] / 2**20:.1f}MB compressed ({store['ratio']:.1f}x), "
+        f"overall memory {plain['memory'] / packed['memory']:.1f}x smaller"
+    )
+
+
+if __name__ == "__main__":
+    main()
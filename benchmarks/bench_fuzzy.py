@@ -0,0 +1,158 @@
+"""
+Latency benchmark for typo-tolerant search.
+
+Builds a synthetic corpus whose vocabulary mixes the bundled quotes' words
+with generated ones under a Zipf-like frequency distribution, then times
+fuzzy searches for misspelled words against exact substring search and a
+brute-force edit-distance scan of the vocabulary.
+
+Usage:
+    python -m benchmarks.bench_fuzzy [--quotes N] [--vocabulary N] [--queries N]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+from typing import List
+
+from quotes_generator import QuoteGenerator
+from quotes_generator.fuzzy import edit_distance, tokenize
+
+
+def make_vocabulary(size: int, rng: random.Random) -> List[str]:
+    """
+    Build a vocabulary of real and generated words, most frequent first.
+
+    Args:
+        size: Number of words.
+        rng: Random stream.
+
+    Returns:
+        Distinct lowercase words.
+    """
+    words = list(dict.fromkeys(
+        word for quote in QuoteGenerator().quotes for word in tokenize(quote["text"])
+    ))
+    seen = set(words)
+    while len(words) < size:
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 11)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words[:size]
+
+
+def make_corpus(path: str, count: int, vocabulary: List[str], rng: random.Random) -> None:
+    """
+    Write a synthetic quotes file with 6-20 words per quote.
+
+    Args:
+        path: Output file path.
+        count: Number of quotes.
+        vocabulary: Words, most frequent first.
+        rng: Random stream.
+    """
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    quotes = []
+    for _ in range(count):
+        words = rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(6, 20))
+        quotes.append({"text": " ".join(words).capitalize() + ".", "author": "Anonymous", "category": "synthetic"})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"quotes": quotes}, f)
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    """Apply one random deletion, insertion, substitution or transposition."""
+    i = rng.randrange(len(word))
+    edit = rng.choice(("delete", "insert", "substitute", "transpose"))
+    if edit == "delete":
+        return word[:i] + word[i + 1:]
+    if edit == "insert":
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+    if edit == "substitute":
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+    i = min(i, len(word) - 2)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def index_size(index) -> int:
+    """Approximate memory of a ``FuzzyIndex`` in bytes, excluding term strings."""
+    size = sys.getsizeof(index._terms) + sys.getsizeof(index._deletes)
+    size += sum(sys.getsizeof(postings) for postings in index._terms.values())
+    for variant, entry in index._deletes.items():
+        size += sys.getsizeof(variant)
+        if not isinstance(entry, str):
+            size += sys.getsizeof(entry)
+    return size
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Value below which ``fraction`` of the samples fall."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def time_calls(func, queries: List[str]) -> List[float]:
+    """Time one call per query, in microseconds."""
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def main():
+    """Run the benchmark and print a latency table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quotes", type=int, default=1000000, help="Corpus size")
+    parser.add_argument("--vocabulary", type=int, default=50000, help="Distinct words")
+    parser.add_argument("--queries", type=int, default=200, help="Misspelled queries")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    vocabulary = make_vocabulary(args.vocabulary, rng)
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        make_corpus(path, args.quotes, vocabulary, rng)
+        generator = QuoteGenerator(path)
+    finally:
+        os.unlink(path)
+
+    start = time.perf_counter()
+    index = generator._build_fuzzy_index(generator._state)
+    build_seconds = time.perf_counter() - start
+
+    # Misspell mid-frequency words; the most common ones match huge result sets.
+    candidates = [word for word in vocabulary[100:] if len(word) >= 5]
+    queries = [misspell(rng.choice(candidates), rng) for _ in range(args.queries)]
+    scan_queries = queries[:max(1, args.queries // 20)]
+    words = list(index._terms)
+
+    rows = [
+        ("lookup (d=1)", time_calls(lambda q: index.lookup(q, 1), queries)),
+        ("lookup (d=2)", time_calls(lambda q: index.lookup(q, 2), queries)),
+        ("fuzzy search (d=1)", time_calls(lambda q: generator.search_quotes(q, fuzzy=True), queries)),
+        ("vocabulary scan (d=1)", time_calls(
+            lambda q: [w for w in words if edit_distance(q, w, 1) <= 1], scan_queries)),
+        ("substring search", time_calls(generator.search_quotes, scan_queries)),
+    ]
+
+    stats = index.stats()
+    print(f"{args.quotes:,} quotes, {stats['terms']:,} terms, {stats['postings']:,} postings")
+    print(f"Index build {build_seconds:.1f}s, ~{index_size(index) / 2**20:.0f}MB "
+          f"({stats['delete_entries']:,} delete entries)\n")
+    print(f"{'operation':<22}  {'p50':>10}  {'p99':>10}")
+    for name, samples in rows:
+        print(f"{name:<22}  {percentile(samples, 0.5):>8.0f}µs  {percentile(samples, 0.99):>8.0f}µs")
+
+
+if __name__ == "__main__":
+    main()
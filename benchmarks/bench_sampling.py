@@ -0,0 +1,90 @@
+"""
+Multi-threaded sampling throughput benchmark.
+
+Compares drawing from one shared ``random.Random`` (the old behaviour of
+using the global ``random`` module) with the per-thread streams of
+``RandomSource``. On free-threaded CPython builds (``python3.13t`` and
+later) per-thread streams should scale with the number of cores; with the
+GIL both variants are serialized and the numbers mainly show overhead.
+
+Usage:
+    python -m benchmarks.bench_sampling [--calls N] [--threads 1,2,4,8]
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+from quotes_generator import QuoteGenerator
+from quotes_generator.rng import RandomSource
+
+
+class _SharedSource(RandomSource):
+    """RandomSource that hands every thread the same generator."""
+
+    def __init__(self):
+        super().__init__()
+        self._shared = random.Random()
+
+    def get(self) -> random.Random:
+        return self._shared
+
+
+def run(generator: QuoteGenerator, threads: int, calls: int) -> float:
+    """
+    Sample from several threads at once.
+
+    Args:
+        generator: Generator to sample from.
+        threads: Number of worker threads.
+        calls: Calls per thread.
+
+    Returns:
+        Throughput in calls per second.
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for _ in range(calls):
+            generator.get_multiple_quotes(5)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * calls / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print a throughput table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000, help="Calls per thread")
+    parser.add_argument("--threads", type=str, default="1,2,4,8", help="Thread counts")
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}\n")
+    print(f"{'threads':>8}  {'shared calls/s':>15}  {'per-thread calls/s':>19}  {'speedup':>8}")
+
+    shared = QuoteGenerator(rng=_SharedSource())
+    per_thread = QuoteGenerator(rng=RandomSource())
+    baseline = None
+    for threads in (int(t) for t in args.threads.split(",")):
+        shared_rate = run(shared, threads, args.calls)
+        thread_rate = run(per_thread, threads, args.calls)
+        if baseline is None:
+            baseline = thread_rate
+        print(
+            f"{threads:>8}  {shared_rate:>15,.0f}  {thread_rate:>19,.0f}  "
+            f"{thread_rate / baseline:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
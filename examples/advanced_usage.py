@@ -70,6 +70,15 @@ def main():
         avg_length = sum(len(q['text']) for q in category_quotes) / len(category_quotes)
         print(f"{category.capitalize()}: {len(category_quotes)} quotes, "
               f"avg length: {avg_length:.0f} chars")
+    print()
+    
+    # Length-based queries
+    print("📏 Length Queries")
+    print("=" * 60)
+    short_quotes = generator.get_quotes_by_length(max_length=60)
+    print(f"{len(short_quotes)} quotes fit in 60 characters")
+    for quote in generator.get_longest_quotes(3):
+        print(f"  • {len(quote['text'])} chars — {quote['author']}")
 
 
 if __name__ == "__main__":
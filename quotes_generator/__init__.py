@@ -19,6 +19,24 @@ __email__ = "kiara@example.com"
 __license__ = "MIT"
 __url__ = "https://github.com/kiaraelix/random-quotes-generator"
 
+from .aio import AsyncQuoteGenerator
 from .generator import QuoteGenerator
+from .metrics import Metrics
+from .profiling import Profiler
+from .registry import CorpusRegistry
+from .response_cache import ResponseCache
+from .rng import RandomSource
+from .seen import SeenBitset, SeenBloomFilter
 
-__all__ = ["QuoteGenerator", "__version__"]
+__all__ = [
+    "QuoteGenerator",
+    "AsyncQuoteGenerator",
+    "CorpusRegistry",
+    "Metrics",
+    "Profiler",
+    "RandomSource",
+    "ResponseCache",
+    "SeenBitset",
+    "SeenBloomFilter",
+    "__version__",
+]
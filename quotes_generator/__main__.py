@@ -4,8 +4,11 @@ Command-line interface for the Random Quotes Generator.
 
 import argparse
 import sys
+from contextlib import nullcontext
 from .generator import QuoteGenerator
 from .formatter import format_quote, format_statistics, print_header
+from .metrics import Metrics
+from .profiling import Profiler
 
 
 def main():
@@ -21,6 +24,9 @@ Examples:
   %(prog)s --count 3                    Get 3 random quotes
   %(prog)s --stats                      Show collection statistics
   %(prog)s --export output.json         Export all quotes to file
+  %(prog)s --search sucess --fuzzy     Search tolerating typos
+  %(prog)s --search love --metrics      Print metrics after the command
+  %(prog)s --stats --profile            Profile loading and statistics
         """
     )
     
@@ -66,6 +72,12 @@ Examples:
         type=str,
         help="Search for quotes containing a keyword",
     )
+
+    parser.add_argument(
+        "--fuzzy",
+        action="store_true",
+        help="Make --search tolerate typos (whole-word matching)",
+    )
     
     parser.add_argument(
         "--export",
@@ -80,13 +92,62 @@ Examples:
         help="Disable colored output",
     )
 
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Print instrumentation metrics (Prometheus text format) to stderr",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the command with cProfile and tracemalloc and print a report to stderr",
+    )
+
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        metavar="PREFIX",
+        help="Write PREFIX.pstats and PREFIX.collapsed (flamegraph stacks); implies --profile",
+    )
+
     args = parser.parse_args()
 
+    metrics = Metrics() if args.metrics else None
+    render = format_quote
+    if metrics is not None:
+        render = metrics.wrap("format_quote", format_quote)
+
+    profiler = Profiler() if args.profile or args.profile_output else None
+
     try:
-        generator = QuoteGenerator()
-    except (FileNotFoundError, ValueError) as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        with profiler if profiler is not None else nullcontext():
+            try:
+                generator = QuoteGenerator(metrics=metrics)
+            except (FileNotFoundError, ValueError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+
+            run(args, generator, render)
+    finally:
+        if metrics is not None:
+            sys.stderr.write(metrics.to_prometheus())
+        if profiler is not None and profiler.report is not None:
+            sys.stderr.write(profiler.report.format())
+            if args.profile_output:
+                profiler.report.dump_stats(f"{args.profile_output}.pstats")
+                profiler.report.write_collapsed(f"{args.profile_output}.collapsed")
+
+
+def run(args, generator, render=format_quote):
+    """
+    Execute the command selected by the parsed CLI arguments.
+
+    Args:
+        args: Parsed command-line arguments.
+        generator: Quote generator to query.
+        render: Function used to format individual quotes.
+    """
 
     # Handle list categories
     if args.list_categories:
@@ -115,11 +176,11 @@ Examples:
 
     # Handle search
     if args.search:
-        results = generator.search_quotes(args.search)
+        results = generator.search_quotes(args.search, fuzzy=args.fuzzy)
         if results:
             print_header(f"Search Results for '{args.search}'", args.no_color)
             for quote in results:
-                print(format_quote(quote, args.no_color))
+                print(render(quote, args.no_color))
         else:
             print(f"\nNo quotes found containing '{args.search}'\n")
         return
@@ -140,7 +201,7 @@ Examples:
         if quotes:
             print_header(f"Quotes by {args.author}", args.no_color)
             for quote in quotes[:args.count]:
-                print(format_quote(quote, args.no_color))
+                print(render(quote, args.no_color))
         else:
             print(f"\nNo quotes found by author: {args.author}\n")
         return
@@ -152,13 +213,13 @@ Examples:
             for i, quote in enumerate(quotes, 1):
                 if i > 1:
                     print()
-                print(format_quote(quote, args.no_color))
+                print(render(quote, args.no_color))
         else:
             print(f"\nNo quotes found for category: {args.category}\n")
     else:
         quote = generator.get_random_quote(category=args.category)
         if quote:
-            print(format_quote(quote, args.no_color))
+            print(render(quote, args.no_color))
         else:
             print(f"\nNo quotes found for category: {args.category}\n")
 
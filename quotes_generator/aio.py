@@ -0,0 +1,235 @@
+"""
+Asyncio interface for the quotes generator.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+from .generator import QuoteGenerator
+from .normalize import fold
+
+# Blocking QuoteGenerator methods and their awaitable replacements.
+_BLOCKING_METHODS = {"export_quotes": "export"}
+
+
+class AsyncQuoteGenerator:
+    """
+    Asyncio wrapper around ``QuoteGenerator``.
+
+    Loading, reloading and exporting run in an executor so the event loop
+    keeps serving other tasks. In-memory queries are called directly, since
+    they do not block on I/O; for large result sets, ``iter_search`` and
+    ``iter_by_author`` scan in chunks and yield control between them.
+    Fuzzy search and ``max_per_author`` batches need an index that is built
+    on first use; ``search`` and ``sample`` build it in the executor.
+
+    Any other ``QuoteGenerator`` method or attribute (``get_random_quote``,
+    ``get_categories``, ``quotes``, ...) is available on this object once
+    loaded.
+
+    Example:
+        >>> generator = await AsyncQuoteGenerator.create()
+        >>> quote = generator.get_random_quote()
+        >>> async for quote in generator.iter_search("life"):
+        ...     print(quote["text"])
+    """
+
+    def __init__(self, quotes_file: Optional[str] = None,
+                 executor: Optional[Executor] = None, **options: Any):
+        """
+        Initialize the wrapper without loading anything.
+
+        Args:
+            quotes_file: Path to custom quotes JSON file. If None, uses default.
+            executor: Executor for blocking work. If None, the event loop's
+                default executor is used.
+            options: Keyword arguments passed to ``QuoteGenerator``.
+        """
+        self.quotes_file = quotes_file
+        self.executor = executor
+        self.options = options
+        self._generator: Optional[QuoteGenerator] = None
+
+    @classmethod
+    async def create(cls, quotes_file: Optional[str] = None,
+                     executor: Optional[Executor] = None,
+                     **options: Any) -> "AsyncQuoteGenerator":
+        """
+        Create and load a generator.
+
+        Args:
+            quotes_file: Path to custom quotes JSON file. If None, uses default.
+            executor: Executor for blocking work.
+            options: Keyword arguments passed to ``QuoteGenerator``.
+
+        Returns:
+            The loaded generator.
+        """
+        generator = cls(quotes_file, executor, **options)
+        await generator.load()
+        return generator
+
+    @property
+    def generator(self) -> QuoteGenerator:
+        """
+        The loaded synchronous generator.
+
+        Raises:
+            RuntimeError: If ``load`` has not completed.
+        """
+        if self._generator is None:
+            raise RuntimeError("AsyncQuoteGenerator is not loaded; await load() first")
+        return self._generator
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a collection has been loaded."""
+        return self._generator is not None
+
+    async def load(self) -> None:
+        """
+        Parse, validate and index the quotes file in the executor.
+
+        Raises:
+            FileNotFoundError: If the quotes file doesn't exist.
+            ValueError: If the quotes file is invalid.
+        """
+        self._generator = await self._run(
+            partial(QuoteGenerator, self.quotes_file, **self.options)
+        )
+
+    async def reload(self) -> None:
+        """
+        Reload the quotes file in the executor.
+
+        A complete new collection with its indexes is built off the loop and
+        swapped in at once, so queries running meanwhile see either the old
+        or the new collection, never a mix. On error the old collection is
+        kept.
+
+        Raises:
+            FileNotFoundError: If the quotes file doesn't exist.
+            ValueError: If the quotes file is invalid.
+        """
+        await self.load()
+        cache = self.options.get("response_cache")
+        if cache is not None:
+            cache.clear()
+
+    async def export(self, output_file: str, category: Optional[str] = None) -> None:
+        """
+        Export quotes to a JSON file in the executor.
+
+        Args:
+            output_file: Path to output file.
+            category: Optional category filter.
+        """
+        await self._run(partial(self.generator.export_quotes, output_file, category=category))
+
+    async def search(self, keyword: str, fuzzy: bool = False,
+                     max_distance: int = 1) -> List[Dict[str, str]]:
+        """
+        Search for quotes, building the fuzzy index in the executor.
+
+        Same as ``QuoteGenerator.search_quotes``, except that the first
+        fuzzy search does not block the loop while the index is built.
+
+        Args:
+            keyword: Keyword to search for in quote text.
+            fuzzy: If True, match whole words allowing typos.
+            max_distance: Largest edit distance per word in fuzzy mode.
+
+        Returns:
+            List of matching quotes.
+        """
+        generator = self.generator
+        state = generator._state
+        if fuzzy and state.fuzzy_index is None:
+            await self._run(partial(generator._build_fuzzy_index, state))
+        found: List[Dict[str, str]] = generator.search_quotes(keyword, fuzzy=fuzzy,
+                                                              max_distance=max_distance)
+        return found
+
+    async def sample(self, count: int, category: Optional[str] = None,
+                     seed: Optional[int] = None, strategy: str = "uniform",
+                     max_per_author: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Get multiple random quotes, building the author index in the executor.
+
+        Same as ``QuoteGenerator.get_multiple_quotes``, except that the
+        first ``max_per_author`` batch does not block the loop while the
+        per-author index is built.
+
+        Args:
+            count: Number of quotes to retrieve.
+            category: Optional category filter.
+            seed: Optional seed making this call reproducible.
+            strategy: ``"uniform"`` or ``"stratified"``.
+            max_per_author: Largest number of quotes by one author, or None.
+
+        Returns:
+            List of quote dictionaries.
+        """
+        generator = self.generator
+        state = generator._state
+        if max_per_author is not None and state.author_index is None:
+            await self._run(partial(generator._build_author_index, state))
+        batch: List[Dict[str, str]] = generator.get_multiple_quotes(
+            count, category=category, seed=seed, strategy=strategy, max_per_author=max_per_author
+        )
+        return batch
+
+    async def iter_search(self, keyword: str, chunk_size: int = 1024) -> AsyncIterator[Dict[str, str]]:
+        """
+        Iterate over quotes containing a keyword, yielding to the loop
+        after every ``chunk_size`` quotes scanned.
+
+        Args:
+            keyword: Keyword to search for in quote text.
+            chunk_size: Number of quotes scanned between yields.
+        """
+        state = self.generator._state
+        async for quote in self._iter_matches(state.quotes, state.text_keys,
+                                              fold(keyword), chunk_size):
+            yield quote
+
+    async def iter_by_author(self, author: str, chunk_size: int = 1024) -> AsyncIterator[Dict[str, str]]:
+        """
+        Iterate over quotes by an author, yielding to the loop after every
+        ``chunk_size`` quotes scanned.
+
+        Args:
+            author: Author name (case-insensitive partial match).
+            chunk_size: Number of quotes scanned between yields.
+        """
+        state = self.generator._state
+        async for quote in self._iter_matches(state.quotes, state.author_keys,
+                                              fold(author), chunk_size):
+            yield quote
+
+    @staticmethod
+    async def _iter_matches(quotes: Sequence[Dict[str, str]], keys: Sequence[str],
+                            needle: str, chunk_size: int) -> AsyncIterator[Dict[str, str]]:
+        """Match ``needle`` against consecutive slices of the keys."""
+        for start in range(0, len(quotes), chunk_size):
+            stop = start + chunk_size
+            for quote in QuoteGenerator._filter_by_key(quotes[start:stop], keys[start:stop], needle):
+                yield quote
+            await asyncio.sleep(0)
+
+    async def _run(self, func: Callable[[], Any]) -> Any:
+        """Run a blocking callable in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in _BLOCKING_METHODS:
+            raise AttributeError(
+                f"{name} blocks on file I/O; use the awaitable "
+                f"{_BLOCKING_METHODS[name]}() instead"
+            )
+        return getattr(self.generator, name)
@@ -0,0 +1,289 @@
+"""
+Compressed in-memory storage for quote text.
+
+Texts are packed into fixed-size blocks that are compressed independently,
+so reading one quote only decompresses its block. Recently used blocks are
+kept decompressed in a small LRU.
+"""
+
+import lzma
+import threading
+import zlib
+from array import array
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+CODECS = ("zlib", "lzma")
+
+# zlib only looks back 32 KiB, so a larger preset dictionary is wasted.
+MAX_DICTIONARY_SIZE = 32 * 1024
+
+
+def train_dictionary(texts: Iterable[str], size: int = MAX_DICTIONARY_SIZE) -> bytes:
+    """
+    Build a zlib preset dictionary from frequent words.
+
+    Words are ranked by ``frequency * length`` (the bytes they could save)
+    and the most valuable ones are placed at the end of the dictionary,
+    where back-references are shortest.
+
+    Args:
+        texts: Sample texts.
+        size: Maximum dictionary size in bytes.
+
+    Returns:
+        Dictionary bytes (possibly empty).
+    """
+    counts = Counter(word for text in texts for word in text.split())
+    ranked = sorted(
+        (word for word, count in counts.items() if count > 1),
+        key=lambda word: counts[word] * len(word),
+        reverse=True,
+    )
+    parts: List[bytes] = []
+    total = 0
+    for word in ranked:
+        encoded = word.encode("utf-8") + b" "
+        if total + len(encoded) > size:
+            break
+        parts.append(encoded)
+        total += len(encoded)
+    return b"".join(reversed(parts))
+
+
+class CompressedTextStore:
+    """
+    Append-only sequence of strings stored in compressed blocks.
+
+    Each block holds up to ``block_size`` texts concatenated as UTF-8; an
+    offsets array locates every text inside its block. The ``zlib`` codec
+    uses a shared dictionary trained on the corpus, which matters for small
+    blocks; the ``lzma`` codec has no preset-dictionary support in the
+    standard library and benefits from larger blocks instead.
+
+    Example:
+        >>> store = CompressedTextStore(["first text", "second text"])
+        >>> store[1]
+        'second text'
+    """
+
+    def __init__(self, texts: Iterable[str] = (), block_size: int = 16,
+                 codec: str = "zlib", level: int = 9,
+                 dictionary: Optional[bytes] = None, cache_blocks: int = 16):
+        """
+        Initialize the store.
+
+        Args:
+            texts: Initial texts.
+            block_size: Number of texts per compressed block. Larger blocks
+                compress better but make each cold read slower.
+            codec: ``"zlib"`` or ``"lzma"``.
+            level: Compression level (zlib 0-9, lzma preset 0-9).
+            dictionary: zlib preset dictionary. If None, one is trained on
+                the initial texts.
+            cache_blocks: Number of decompressed blocks kept in the LRU.
+
+        Raises:
+            ValueError: If the codec is unknown or a size is not positive.
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Unsupported codec {codec!r}; expected one of {CODECS}")
+        if block_size <= 0 or cache_blocks <= 0:
+            raise ValueError("block_size and cache_blocks must be positive")
+
+        texts = list(texts)
+        self.block_size = block_size
+        self.codec = codec
+        self.level = level
+        self.cache_blocks = cache_blocks
+        if codec == "zlib" and dictionary is None:
+            dictionary = train_dictionary(texts)
+        self.dictionary = dictionary if codec == "zlib" else b""
+
+        self._blocks: List[bytes] = []
+        self._offsets = array("I")
+        self._pending: List[str] = []
+        self._cache: "OrderedDict[int, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        for text in texts:
+            self.append(text)
+
+    def __len__(self) -> int:
+        return len(self._blocks) * self.block_size + len(self._pending)
+
+    def __iter__(self) -> Iterator[str]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __getitem__(self, idx: int) -> str:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("text index out of range")
+        block_no, slot = divmod(idx, self.block_size)
+        if block_no == len(self._blocks):
+            return self._pending[slot]
+
+        data = self._block(block_no)
+        start = self._offsets[idx]
+        end = self._offsets[idx + 1] if slot + 1 < self.block_size else len(data)
+        return data[start:end].decode("utf-8")
+
+    def append(self, text: str) -> None:
+        """
+        Add a text to the end of the store.
+
+        Texts are compressed once a full block has accumulated.
+
+        Args:
+            text: Text to add.
+        """
+        self._pending.append(text)
+        if len(self._pending) == self.block_size:
+            self._flush()
+
+    @property
+    def compressed_bytes(self) -> int:
+        """Total size of the compressed blocks and dictionary."""
+        return sum(len(block) for block in self._blocks) + len(self.dictionary)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get storage statistics.
+
+        Returns:
+            Dictionary with texts, blocks, compressed_bytes, raw_bytes and
+            ratio (raw / compressed).
+        """
+        raw = sum(len(text.encode("utf-8")) for text in self)
+        compressed = self.compressed_bytes + sum(len(t.encode("utf-8")) for t in self._pending)
+        return {
+            "texts": len(self),
+            "blocks": len(self._blocks),
+            "compressed_bytes": compressed,
+            "raw_bytes": raw,
+            "ratio": raw / compressed if compressed else 0.0,
+        }
+
+    def _flush(self) -> None:
+        """Compress the pending texts into a new block."""
+        encoded = [text.encode("utf-8") for text in self._pending]
+        offset = 0
+        for data in encoded:
+            self._offsets.append(offset)
+            offset += len(data)
+        self._blocks.append(self._compress(b"".join(encoded)))
+        self._pending = []
+
+    def _block(self, block_no: int) -> bytes:
+        """Get a decompressed block, going through the LRU."""
+        with self._lock:
+            data = self._cache.get(block_no)
+            if data is not None:
+                self._cache.move_to_end(block_no)
+                return data
+        data = self._decompress(self._blocks[block_no])
+        with self._lock:
+            self._cache[block_no] = data
+            while len(self._cache) > self.cache_blocks:
+                self._cache.popitem(last=False)
+        return data
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == "lzma":
+            return lzma.compress(data, preset=self.level)
+        if self.dictionary:
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, -15, zdict=self.dictionary)
+        else:
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, -15)
+        return compressor.compress(data) + compressor.flush()
+
+    def _decompress(self, data: bytes) -> bytes:
+        if self.codec == "lzma":
+            return lzma.decompress(data)
+        if self.dictionary:
+            return zlib.decompressobj(-15, zdict=self.dictionary).decompress(data)
+        return zlib.decompressobj(-15).decompress(data)
+
+
+class CompressedQuote(Mapping):
+    """
+    Read-only quote whose ``text`` lives in a ``CompressedTextStore``.
+
+    Behaves like the plain quote dictionary for lookups, iteration and
+    equality; use ``dict(quote)`` where a real ``dict`` is required (e.g.
+    ``json.dumps``). Author and category are held in slots, and any other
+    fields in an optional ``extra`` dictionary.
+    """
+
+    __slots__ = ("_store", "_index", "_author", "_category", "_extra")
+
+    def __init__(self, store: CompressedTextStore, index: int, author: str,
+                 category: str, extra: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the quote.
+
+        Args:
+            store: Store holding the text.
+            index: Position of the text in the store.
+            author: Author name.
+            category: Category name.
+            extra: Any further fields, or None.
+        """
+        self._store = store
+        self._index = index
+        self._author = author
+        self._category = category
+        self._extra = extra or None
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "text":
+            return self._store[self._index]
+        if key == "author":
+            return self._author
+        if key == "category":
+            return self._category
+        if self._extra is not None:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield "text"
+        yield "author"
+        yield "category"
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return 3 + (len(self._extra) if self._extra is not None else 0)
+
+    def __repr__(self) -> str:
+        return f"CompressedQuote({dict(self)!r})"
+
+
+def pack_quotes(quotes: Iterable[Mapping[str, Any]],
+                store: CompressedTextStore,
+                strings: Optional[Dict[str, str]] = None) -> List[CompressedQuote]:
+    """
+    Append quote texts to a store and wrap the quotes around it.
+
+    Args:
+        quotes: Quotes with text, author and category.
+        store: Store receiving the texts.
+        strings: Table used to share equal author and category strings.
+            A new one is used if None.
+
+    Returns:
+        One ``CompressedQuote`` per input quote.
+    """
+    if strings is None:
+        strings = {}
+    packed = []
+    for quote in quotes:
+        store.append(quote["text"])
+        author = strings.setdefault(quote["author"], quote["author"])
+        category = strings.setdefault(quote["category"], quote["category"])
+        extra = {k: v for k, v in quote.items() if k not in ("text", "author", "category")}
+        packed.append(CompressedQuote(store, len(store) - 1, author, category, extra))
+    return packed
@@ -0,0 +1,256 @@
+"""
+Typo-tolerant word index for fuzzy search.
+
+Uses the symmetric-delete approach: every vocabulary word is indexed under
+all strings obtained by deleting up to ``max_distance`` characters from its
+prefix. A query word generates its own deletes and looks them up, so
+candidate words within the edit distance are found without comparing the
+query against the whole vocabulary. Candidates are then verified with an
+exact edit distance, and quote positions are resolved through a term index.
+"""
+
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, Set, Tuple, Union
+
+from .normalize import fold
+
+_WORD = re.compile(r"\w+(?:'\w+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into folded words (see ``normalize.fold``). Contractions
+    such as ``don't`` are kept as one word.
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        Words in order of appearance.
+    """
+    return _WORD.findall(fold(text))
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Damerau-Levenshtein (optimal string alignment) distance with a cutoff.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each count as one edit.
+
+    Args:
+        a: First string.
+        b: Second string.
+        max_distance: Largest distance of interest.
+
+    Returns:
+        The distance, or ``max_distance + 1`` if it exceeds ``max_distance``.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    before = None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                value = min(value, before[j - 2] + 1)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        before, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    """The word and every string obtained by deleting up to ``distance`` characters."""
+    result = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+class FuzzyIndex:
+    """
+    Word-level index supporting exact and typo-tolerant lookups.
+
+    ``_terms`` maps each word to an array of the positions of the quotes
+    containing it. ``_deletes`` maps each delete variant of a word prefix to
+    the word, or to a list of words when several share the variant.
+
+    Example:
+        >>> index = FuzzyIndex.build(["Stay hungry", "Stay foolish"])
+        >>> index.search("foolsh", max_distance=1)
+        [1]
+    """
+
+    def __init__(self, max_distance: int = 2, prefix_length: int = 7):
+        """
+        Initialize an empty index.
+
+        Args:
+            max_distance: Largest edit distance supported by ``search``.
+                Memory grows quickly with it.
+            prefix_length: Only the first ``prefix_length`` characters of
+                each word generate deletes, bounding the index size for
+                long words. Candidates are still verified on the full word.
+
+        Raises:
+            ValueError: If max_distance is negative or prefix_length is not
+                greater than max_distance.
+        """
+        if max_distance < 0:
+            raise ValueError(f"max_distance must not be negative, got {max_distance}")
+        if prefix_length <= max_distance:
+            raise ValueError("prefix_length must be greater than max_distance")
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._terms: Dict[str, array] = {}
+        self._deletes: Dict[str, Union[str, List[str]]] = {}
+
+    @classmethod
+    def build(cls, texts: Iterable[str], **options: Any) -> "FuzzyIndex":
+        """
+        Build an index over texts, using their order as positions.
+
+        Args:
+            texts: Quote texts.
+            options: Keyword arguments for the constructor.
+
+        Returns:
+            The populated index.
+        """
+        index = cls(**options)
+        for position, text in enumerate(texts):
+            index.add(position, text)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def add(self, position: int, text: str) -> None:
+        """
+        Index the words of one quote.
+
+        Args:
+            position: Position of the quote. Must be greater than every
+                position already indexed.
+            text: Quote text.
+        """
+        for word in set(tokenize(text)):
+            postings = self._terms.get(word)
+            if postings is None:
+                postings = self._terms[word] = array("I")
+                self._add_deletes(word)
+            postings.append(position)
+
+    def _add_deletes(self, word: str) -> None:
+        deletes = self._deletes
+        for variant in _deletes(word[:self.prefix_length], self.max_distance):
+            entry = deletes.get(variant)
+            if entry is None:
+                deletes[variant] = word
+            elif isinstance(entry, str):
+                deletes[variant] = [entry, word]
+            else:
+                entry.append(word)
+
+    def lookup(self, word: str, max_distance: int = 1) -> Dict[str, int]:
+        """
+        Find indexed words within an edit distance of a word.
+
+        A word of length n never matches at distance n or more, so very
+        short words need closer matches.
+
+        Args:
+            word: Folded query word.
+            max_distance: Largest edit distance to accept.
+
+        Returns:
+            Mapping of matching words to their distance.
+
+        Raises:
+            ValueError: If max_distance is negative or exceeds the index's.
+        """
+        if not 0 <= max_distance <= self.max_distance:
+            raise ValueError(f"max_distance must be between 0 and {self.max_distance}, got {max_distance}")
+        limit = min(max_distance, len(word) - 1)
+        if limit <= 0:
+            return {word: 0} if word in self._terms else {}
+
+        matches: Dict[str, int] = {}
+        checked: Set[str] = set()
+        for variant in _deletes(word[:self.prefix_length], limit):
+            entry = self._deletes.get(variant)
+            if entry is None:
+                continue
+            for candidate in ((entry,) if isinstance(entry, str) else entry):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                distance = edit_distance(word, candidate, limit)
+                if distance <= limit:
+                    matches[candidate] = distance
+        return matches
+
+    def search(self, query: str, max_distance: int = 1) -> List[int]:
+        """
+        Find quotes containing every word of a query, allowing typos.
+
+        Args:
+            query: Query text.
+            max_distance: Largest edit distance per query word.
+
+        Returns:
+            Quote positions ranked by total edit distance, so quotes with
+            exact word matches come first; ties keep collection order.
+
+        Raises:
+            ValueError: If max_distance is out of range.
+        """
+        expansions = [self.lookup(word, max_distance) for word in dict.fromkeys(tokenize(query))]
+        if not expansions:
+            return []
+        # Start from the rarest word so later words only probe a small set.
+        expansions.sort(key=lambda terms: sum(len(self._terms[term]) for term in terms))
+
+        scores: Dict[int, int] = {}
+        for terms in expansions[:1]:
+            for term, distance in terms.items():
+                for position in self._terms[term]:
+                    if distance < scores.get(position, max_distance + 1):
+                        scores[position] = distance
+        for terms in expansions[1:]:
+            best: Dict[int, int] = {}
+            for term, distance in terms.items():
+                for position in self._terms[term]:
+                    if position in scores and distance < best.get(position, max_distance + 1):
+                        best[position] = distance
+            scores = {position: scores[position] + distance for position, distance in best.items()}
+            if not scores:
+                break
+        ranked: List[Tuple[int, int]] = sorted((score, position) for position, score in scores.items())
+        return [position for _, position in ranked]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with terms, delete_entries and postings counts.
+        """
+        return {
+            "terms": len(self._terms),
+            "delete_entries": len(self._deletes),
+            "postings": sum(len(postings) for postings in self._terms.values()),
+        }
@@ -4,10 +4,71 @@ Core quote generator functionality.
 
 import json
 import random
+from array import array
+from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from collections import Counter
 
+from .metrics import Metrics, instrumented
+from .normalize import FoldedField, check_quote, fold, normalize_quotes
+from .compressed import CompressedTextStore, pack_quotes, train_dictionary
+from .formatter import format_quote
+from .fuzzy import FuzzyIndex
+from .length_index import LengthIndex
+from .profiling import phase
+from .response_cache import ResponseCache
+from .rng import RandomSource
+from .sampling import PositionGroups, stratified_sample
+from .schedule import KeyedPermutation, schedule_key
+from .seen import SeenBloomFilter, SeenFilter
+
+RENDER_FORMATS = ("json", "text", "color")
+SAMPLING_STRATEGIES = ("uniform", "stratified")
+# Uniform picks tried before get_random_quote lists the unseen quotes.
+EXCLUDE_ATTEMPTS = 8
+
+
+class _CorpusState:
+    """
+    One loaded collection with its folded keys and indexes.
+
+    Queries read ``QuoteGenerator._state`` once and use only that object,
+    and ``reload`` replaces it with a single assignment, so a query never
+    combines two collections. ``add_quote`` and the lazily built indexes
+    update the current state in place.
+    """
+
+    __slots__ = (
+        "quotes", "text_store", "author_keys", "text_keys", "folded",
+        "category_index", "length_index", "category_length_index",
+        "fuzzy_index", "author_index", "category_author_index",
+    )
+
+    def __init__(self, quotes: List[Dict[str, str]], text_store: Optional[CompressedTextStore],
+                 author_keys: List[str], text_keys: Sequence[str], folded: Dict[str, str]):
+        """
+        Initialize a state with empty indexes.
+
+        Args:
+            quotes: Prepared quotes.
+            text_store: Compressed text storage, or None.
+            author_keys: Folded author per quote.
+            text_keys: Folded text per quote.
+            folded: Cache of folded author and category keys.
+        """
+        self.quotes = quotes
+        self.text_store = text_store
+        self.author_keys = author_keys
+        self.text_keys = text_keys
+        self.folded = folded
+        self.category_index: Dict[str, array] = {}
+        self.length_index = LengthIndex()
+        self.category_length_index: Dict[str, LengthIndex] = {}
+        self.fuzzy_index: Optional[FuzzyIndex] = None
+        self.author_index: Optional[PositionGroups] = None
+        self.category_author_index: Dict[str, PositionGroups] = {}
+
 
 class QuoteGenerator:
     """
@@ -20,26 +81,81 @@ class QuoteGenerator:
     Attributes:
         quotes_file (Path): Path to the quotes JSON file.
         quotes (List[Dict]): List of loaded quotes.
+        metrics (Optional[Metrics]): Metrics collector, or None when
+            instrumentation is disabled.
+        rng (RandomSource): Source of per-thread random streams.
+        response_cache (Optional[ResponseCache]): Cache of pre-serialized
+            quotes used by ``render_quotes``, or None.
+        text_store (Optional[CompressedTextStore]): Compressed storage for
+            quote text when ``compress_text`` is enabled, otherwise None.
     """
 
-    def __init__(self, quotes_file: Optional[str] = None):
+    def __init__(self, quotes_file: Optional[str] = None, metrics: Optional[Metrics] = None,
+                 rng: Optional[RandomSource] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 compress_text: bool = False,
+                 strings: Optional[Dict[str, str]] = None):
         """
         Initialize the quote generator.
 
         Args:
             quotes_file: Path to custom quotes JSON file. If None, uses default.
+            metrics: Optional metrics collector. Instrumentation is disabled
+                when None.
+            rng: Random source used for sampling. If None, a new unseeded
+                source is created.
+            response_cache: Optional cache of encoded JSON and rendered text
+                per quote. Without one, ``render_quotes`` serializes on
+                every call.
+            compress_text: If True, quote text is kept in compressed blocks
+                and decoded on access. Quotes are then read-only
+                ``CompressedQuote`` mappings rather than dicts.
+            strings: Table used to share equal author and category strings,
+                e.g. between generators. If None, a private table is used.
             
         Raises:
             FileNotFoundError: If the quotes file doesn't exist.
-            ValueError: If the quotes file contains invalid JSON.
+            ValueError: If the quotes file contains invalid JSON or invalid
+                quotes.
         """
         if quotes_file is None:
             quotes_file = Path(__file__).parent / "data" / "quotes.json"
         
         self.quotes_file = Path(quotes_file)
-        self.quotes = self._load_quotes()
-        self._validate_quotes()
+        self.metrics = metrics
+        self.rng = rng if rng is not None else RandomSource()
+        self.response_cache = response_cache
+        self.compress_text = compress_text
+        self._strings = strings if strings is not None else {}
+        self._state = self._load_state()
 
+    @property
+    def quotes(self) -> List[Dict[str, str]]:
+        """Loaded quotes, in file order followed by added quotes."""
+        return self._state.quotes
+
+    @property
+    def text_store(self) -> Optional[CompressedTextStore]:
+        """Compressed text storage, or None without ``compress_text``."""
+        return self._state.text_store
+
+    def _load_state(self) -> _CorpusState:
+        """
+        Load, validate and index the quotes file.
+
+        Nothing is assigned to the generator, so the current collection is
+        untouched until the caller installs the result.
+
+        Returns:
+            The new state.
+        """
+        quotes, text_keys = self._validate_quotes(self._load_quotes())
+        state = self._prepare_quotes(quotes, text_keys)
+        self._build_indexes(state)
+        return state
+
+    @instrumented
+    @phase
     def _load_quotes(self) -> List[Dict[str, str]]:
         """
         Load quotes from JSON file.
@@ -64,74 +180,582 @@ class QuoteGenerator:
                 f"Invalid JSON format in quotes file: {self.quotes_file}\n{str(e)}"
             )
 
-    def _validate_quotes(self) -> None:
+    @instrumented(size=lambda result: len(result[0]))
+    @phase
+    def _validate_quotes(self, quotes: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], List[str]]:
         """
-        Validate that all quotes have required fields.
+        Validate and normalize loaded quotes.
+
+        Required fields are stripped, and folded text keys are computed
+        unless text is compressed.
+
+        Args:
+            quotes: Quotes as parsed from the file.
+
+        Returns:
+            ``(quotes, text_keys)``; ``text_keys`` is empty with
+            ``compress_text``.
         
         Raises:
-            ValueError: If any quote is missing required fields.
+            ValueError: Listing every quote that is not an object, misses a
+                required field or has a non-string or empty one.
+        """
+        return normalize_quotes(quotes, text_keys=not self.compress_text)
+
+    @phase
+    def _prepare_quotes(self, quotes: List[Dict[str, str]], text_keys: List[str]) -> _CorpusState:
+        """
+        Prepare validated quotes for storage.
+
+        Equal author and category strings are replaced by one shared object
+        from the string table. With ``compress_text``, the text is moved
+        into a new compressed store. Folded author keys are computed here;
+        they and ``text_keys`` are what queries compare against.
+
+        Args:
+            quotes: Validated quotes.
+            text_keys: Folded text per quote; unused with ``compress_text``.
+
+        Returns:
+            A new state without indexes.
+        """
+        folded: Dict[str, str] = {}
+        author_keys = [self._fold_key(folded, quote["author"]) for quote in quotes]
+        if self.compress_text:
+            store = CompressedTextStore(
+                dictionary=train_dictionary(quote["text"] for quote in quotes)
+            )
+            packed = pack_quotes(quotes, store, self._strings)
+            # Keeping folded copies would undo the compression.
+            return _CorpusState(packed, store, author_keys, FoldedField(packed, "text"), folded)
+
+        strings = self._strings
+        for quote in quotes:
+            quote["author"] = strings.setdefault(quote["author"], quote["author"])
+            quote["category"] = strings.setdefault(quote["category"], quote["category"])
+        return _CorpusState(quotes, None, author_keys, text_keys, folded)
+
+    def _fold_key(self, folded: Dict[str, str], value: str) -> str:
         """
-        required_fields = {"text", "author", "category"}
-        for idx, quote in enumerate(self.quotes):
-            missing = required_fields - set(quote.keys())
-            if missing:
-                raise ValueError(
-                    f"Quote at index {idx} is missing required fields: {missing}"
-                )
+        Folded key for an author or category, computed once per distinct string.
+
+        Args:
+            folded: Cache of the state the key is for.
+            value: Author or category.
+        """
+        key = folded.get(value)
+        if key is None:
+            key = fold(value)
+            key = folded[value] = self._strings.setdefault(key, key)
+        return key
+
+    @phase
+    def _build_indexes(self, state: _CorpusState) -> None:
+        """
+        Build the lookup indexes of a state that is not installed yet.
+
+        ``category_index`` maps each folded category to an array of the
+        positions of its quotes. ``length_index`` and
+        ``category_length_index`` sort positions by text length, globally
+        and per folded category.
+
+        Args:
+            state: State to index.
+        """
+        quotes = state.quotes
+        category_index: Dict[str, array] = {}
+        for idx, quote in enumerate(quotes):
+            category_index.setdefault(self._fold_key(state.folded, quote["category"]), array("I")).append(idx)
+
+        lengths = [len(quote.get("text", "")) for quote in quotes]
+        length_index = LengthIndex.build((length, idx) for idx, length in enumerate(lengths))
+        category_length_index = {
+            key: LengthIndex.build((lengths[idx], idx) for idx in positions)
+            for key, positions in category_index.items()
+        }
+
+        state.category_index = category_index
+        state.length_index = length_index
+        state.category_length_index = category_length_index
 
-    def get_random_quote(self, category: Optional[str] = None) -> Optional[Dict[str, str]]:
+    @phase
+    def _build_fuzzy_index(self, state: _CorpusState) -> FuzzyIndex:
+        """
+        Build the word index used by fuzzy search.
+
+        It is built on the first fuzzy search rather than at load time,
+        since it costs far more than the other indexes.
+
+        Args:
+            state: State to index; the index is stored on it.
+        """
+        index = FuzzyIndex.build(quote.get("text", "") for quote in state.quotes)
+        state.fuzzy_index = index
+        return index
+
+    @phase
+    def _build_author_index(self, state: _CorpusState) -> PositionGroups:
+        """
+        Build the per-author position arrays used by ``max_per_author``.
+
+        ``author_index`` groups all positions by folded author, and
+        ``category_author_index`` does the same within each folded
+        category. Built on the first capped batch, since most callers
+        never need them.
+
+        Args:
+            state: State to index; the indexes are stored on it.
+        """
+        index = PositionGroups()
+        category_index: Dict[str, PositionGroups] = {}
+        for idx, (author, quote) in enumerate(zip(state.author_keys, state.quotes)):
+            index.add(author, idx)
+            key = self._fold_key(state.folded, quote["category"])
+            category_index.setdefault(key, PositionGroups()).add(author, idx)
+        state.category_author_index = category_index
+        state.author_index = index
+        return index
+
+    def _index_quote(self, state: _CorpusState, idx: int) -> None:
+        """
+        Add the quote at ``idx`` to every index.
+
+        Args:
+            state: State holding the quote.
+            idx: Position of a newly appended quote.
+        """
+        quote = state.quotes[idx]
+        key = self._fold_key(state.folded, quote["category"])
+        length = len(quote.get("text", ""))
+        state.category_index.setdefault(key, array("I")).append(idx)
+        state.length_index.add(length, idx)
+        state.category_length_index.setdefault(key, LengthIndex()).add(length, idx)
+        if state.fuzzy_index is not None:
+            state.fuzzy_index.add(idx, quote.get("text", ""))
+        if state.author_index is not None:
+            author = state.author_keys[idx]
+            state.author_index.add(author, idx)
+            state.category_author_index.setdefault(key, PositionGroups()).add(author, idx)
+
+    @staticmethod
+    def _length_index_for(state: _CorpusState, category: Optional[str]) -> LengthIndex:
+        """Length index for a category, or the global one when None."""
+        if category:
+            return state.category_length_index.get(fold(category), LengthIndex())
+        return state.length_index
+
+    @instrumented
+    def add_quote(self, quote: Dict[str, str]) -> None:
+        """
+        Add a quote to the collection and update all indexes.
+
+        A copy is stored, so changing ``quote`` afterwards does not affect
+        the collection.
+
+        Args:
+            quote: Quote dictionary with text, author, and category.
+
+        Raises:
+            ValueError: If the quote misses a required field or has a
+                non-string or empty one.
+        """
+        if isinstance(quote, dict):
+            quote = dict(quote)
+        problem = check_quote(quote)
+        if problem is not None:
+            raise ValueError(f"Quote {problem}")
+        state = self._state
+        if state.text_store is not None:
+            quote = pack_quotes([quote], state.text_store, self._strings)[0]
+        else:
+            quote["author"] = self._strings.setdefault(quote["author"], quote["author"])
+            quote["category"] = self._strings.setdefault(quote["category"], quote["category"])
+        if isinstance(state.text_keys, list):
+            state.text_keys.append(fold(quote["text"]))
+        state.author_keys.append(self._fold_key(state.folded, quote["author"]))
+        state.quotes.append(quote)
+        self._index_quote(state, len(state.quotes) - 1)
+
+    @instrumented
+    def reload(self) -> None:
+        """
+        Reload quotes from ``quotes_file`` and rebuild all indexes.
+
+        The new collection, its folded keys and indexes are built into a
+        new state object, which replaces the current one with a single
+        assignment. Queries already running finish on the state they
+        started with. The current collection is kept if the file cannot
+        be loaded or fails validation. The folded-key cache is rebuilt,
+        dropping entries for authors and categories no longer present.
+
+        Raises:
+            FileNotFoundError: If the quotes file doesn't exist.
+            ValueError: If the quotes file is invalid.
+        """
+        self._state = self._load_state()
+        if self.response_cache is not None:
+            self.response_cache.clear()
+
+    @staticmethod
+    def _category_quotes(state: _CorpusState, category: str) -> List[Dict[str, str]]:
+        """
+        Get all quotes in a category (case-insensitive) using the index.
+
+        Args:
+            state: State to read.
+            category: Category name.
+
+        Returns:
+            List of quotes in the category, in collection order.
+        """
+        quotes = state.quotes
+        return [quotes[idx] for idx in state.category_index.get(fold(category), [])]
+
+    @instrumented
+    def get_random_quote(self, category: Optional[str] = None,
+                         seed: Optional[int] = None,
+                         exclude: Optional[SeenFilter] = None,
+                         mark_seen: bool = False) -> Optional[Dict[str, str]]:
         """
         Get a random quote, optionally filtered by category.
 
         Args:
             category: Filter quotes by this category. If None, returns any quote.
+            seed: Optional seed making this call reproducible.
+            exclude: ``SeenBitset`` or ``SeenBloomFilter`` of quote positions
+                to skip, e.g. the quotes a user has already seen.
+            mark_seen: If True, the position of the returned quote is added
+                to ``exclude``.
 
         Returns:
-            Dictionary containing quote text, author, and category, or None if no match.
+            Dictionary containing quote text, author, and category, or None if no match
+            or every matching quote is excluded.
             
         Example:
             >>> generator = QuoteGenerator()
             >>> quote = generator.get_random_quote(category="motivation")
             >>> print(quote["text"])
         """
+        state = self._state
+        rng = self.rng.for_call(seed)
+        if exclude is not None:
+            return self._random_unseen(state, rng, category, exclude, mark_seen)
         if category:
-            filtered_quotes = [
-                q for q in self.quotes 
-                if q.get("category", "").lower() == category.lower()
-            ]
+            filtered_quotes = self._category_quotes(state, category)
             if not filtered_quotes:
                 return None
-            return random.choice(filtered_quotes)
+            return rng.choice(filtered_quotes)
         
-        return random.choice(self.quotes) if self.quotes else None
+        return rng.choice(state.quotes) if state.quotes else None
+
+    @staticmethod
+    def _random_unseen(state: _CorpusState, rng: random.Random, category: Optional[str],
+                       exclude: SeenFilter, mark_seen: bool) -> Optional[Dict[str, str]]:
+        """
+        Pick a random quote whose position is not in ``exclude``.
+
+        A few uniform picks almost always find one while most quotes are
+        unseen; after ``EXCLUDE_ATTEMPTS`` misses, the pick is made among the
+        unseen positions instead. Listing them with a Bloom filter hashes
+        every position, so for one the number of picks is scaled by the
+        estimated share of unseen quotes first, up to the pool size.
+        """
+        pool: Sequence[int]
+        if category:
+            pool = state.category_index.get(fold(category), array("I"))
+        else:
+            pool = range(len(state.quotes))
+        if not pool:
+            return None
+
+        attempts = EXCLUDE_ATTEMPTS
+        if isinstance(exclude, SeenBloomFilter):
+            unseen = max(1, len(pool) - len(exclude))
+            attempts = max(attempts, min(len(pool), EXCLUDE_ATTEMPTS * len(pool) // unseen))
+        for _ in range(attempts):
+            idx = pool[rng.randrange(len(pool))]
+            if idx not in exclude:
+                break
+        else:
+            unseen = exclude.missing(pool)
+            if not unseen:
+                return None
+            idx = rng.choice(unseen)
+        if mark_seen:
+            exclude.add(idx)
+        return state.quotes[idx]
 
-    def get_multiple_quotes(self, count: int, category: Optional[str] = None) -> List[Dict[str, str]]:
+    @instrumented
+    def get_multiple_quotes(self, count: int, category: Optional[str] = None,
+                            seed: Optional[int] = None, strategy: str = "uniform",
+                            max_per_author: Optional[int] = None) -> List[Dict[str, str]]:
         """
         Get multiple random quotes.
         
         Args:
             count: Number of quotes to retrieve.
             category: Optional category filter.
+            seed: Optional seed making this call reproducible.
+            strategy: ``"uniform"`` samples the whole pool evenly, so large
+                categories dominate. ``"stratified"`` spreads the quotes
+                evenly over categories; the counts taken from any two
+                categories differ by at most one unless a category runs out.
+            max_per_author: Largest number of quotes by one author
+                (case-insensitive), or None for no cap. Authors under the
+                cap are picked uniformly, then one of their quotes.
             
         Returns:
-            List of quote dictionaries.
+            List of quote dictionaries. Plain uniform sampling repeats quotes
+            once ``count`` exceeds the pool; with ``"stratified"`` or
+            ``max_per_author`` quotes are never repeated and fewer than
+            ``count`` may be returned.
+
+        Raises:
+            ValueError: If strategy is unknown or max_per_author is not positive.
         """
-        quotes_pool = self.quotes
+        if strategy not in SAMPLING_STRATEGIES:
+            raise ValueError(f"Unsupported strategy {strategy!r}; expected one of {SAMPLING_STRATEGIES}")
+        if max_per_author is not None and max_per_author <= 0:
+            raise ValueError(f"max_per_author must be positive, got {max_per_author}")
+        state = self._state
+        if strategy != "uniform" or max_per_author is not None:
+            return self._sample_distinct(state, count, category, seed, strategy, max_per_author)
+
+        quotes_pool = state.quotes
         if category:
-            quotes_pool = [
-                q for q in self.quotes 
-                if q.get("category", "").lower() == category.lower()
-            ]
+            quotes_pool = self._category_quotes(state, category)
         
         if not quotes_pool:
             return []
         
         # Use sample if count is less than pool size, otherwise use choices
+        rng = self.rng.for_call(seed)
         if count <= len(quotes_pool):
-            return random.sample(quotes_pool, count)
+            return rng.sample(quotes_pool, count)
         else:
-            return random.choices(quotes_pool, k=count)
+            return rng.choices(quotes_pool, k=count)
+
+    def _sample_distinct(self, state: _CorpusState, count: int, category: Optional[str],
+                         seed: Optional[int], strategy: str,
+                         max_per_author: Optional[int]) -> List[Dict[str, str]]:
+        """
+        Sample without repeats from the category index arrays.
+
+        Each category array is one stratum for ``"stratified"``; uniform
+        sampling draws from a single stratum covering the pool. With
+        ``max_per_author``, the strata are the matching per-author groups.
+        """
+        strata: List[Any]
+        if max_per_author is None:
+            if category:
+                strata = [state.category_index.get(fold(category), array("I"))]
+            elif strategy == "stratified":
+                strata = list(state.category_index.values())
+            else:
+                strata = [range(len(state.quotes))]
+        else:
+            author_index = state.author_index
+            if author_index is None:
+                author_index = self._build_author_index(state)
+            if category:
+                strata = [state.category_author_index.get(fold(category), PositionGroups())]
+            elif strategy == "stratified":
+                strata = list(state.category_author_index.values())
+            else:
+                strata = [author_index]
+
+        quotes = state.quotes
+        positions = stratified_sample(strata, count, self.rng.for_call(seed), max_per_group=max_per_author)
+        return [quotes[idx] for idx in positions]
+
+    @instrumented
+    def quote_for(self, day: date, tenant: str, category: Optional[str] = None,
+                  pool_size: Optional[int] = None) -> Optional[Dict[str, str]]:
+        """
+        Get the scheduled quote of the day for a tenant.
+
+        The result is a pure function of the day, tenant, category and pool
+        size, so no state needs to be stored. Days are grouped into blocks as
+        long as the (filtered) pool, and within each block every quote is
+        shown exactly once, in a tenant-specific order. Lookups are O(1).
+
+        The pool size defaults to the current one, so ``add_quote`` or a
+        ``reload`` that changes it also changes the schedule, including
+        today's quote. Pass ``pool_size`` to pin the schedule to the first
+        ``pool_size`` quotes of the pool; quotes added later are appended
+        and do not affect it.
+
+        Args:
+            day: Calendar day (a ``datetime`` is reduced to its date).
+            tenant: Tenant identifier; each tenant gets its own ordering.
+            category: Optional category filter.
+            pool_size: Number of quotes of the pool to schedule, or None
+                for all of them.
+
+        Returns:
+            The quote scheduled for that day, or None if no quotes match.
+
+        Raises:
+            ValueError: If pool_size is not positive or exceeds the pool.
+
+        Example:
+            >>> generator = QuoteGenerator()
+            >>> quote = generator.quote_for(date.today(), tenant="acme")
+        """
+        state = self._state
+        indices = self._schedule_pool(state, category)
+        size = self._schedule_size(indices, pool_size)
+        if not size:
+            return None
+        cycle, position = divmod(day.toordinal(), size)
+        permutation = KeyedPermutation(size, self._schedule_key(tenant, category, cycle))
+        return state.quotes[indices[permutation[position]]]
+
+    @instrumented
+    def quote_calendar(self, year: int, tenants: Iterable[str], category: Optional[str] = None,
+                       pool_size: Optional[int] = None) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Precompute a full year of scheduled quotes for many tenants.
+
+        Produces exactly the same quotes as calling ``quote_for`` for every
+        day, but builds each tenant's permutation once per block of days.
+
+        Args:
+            year: Calendar year.
+            tenants: Tenant identifiers.
+            category: Optional category filter.
+            pool_size: Number of quotes of the pool to schedule, as for
+                ``quote_for``.
+
+        Returns:
+            Mapping of tenant to a list with one quote per day of the year,
+            starting on January 1st. Lists are empty if no quotes match.
+
+        Raises:
+            ValueError: If pool_size is not positive or exceeds the pool.
+        """
+        state = self._state
+        indices = self._schedule_pool(state, category)
+        size = self._schedule_size(indices, pool_size)
+        first = date(year, 1, 1).toordinal()
+        days = date(year + 1, 1, 1).toordinal() - first
+
+        calendar: Dict[str, List[Dict[str, str]]] = {}
+        for tenant in tenants:
+            if not size:
+                calendar[tenant] = []
+                continue
+            quotes = []
+            permutation, current_cycle = None, None
+            for ordinal in range(first, first + days):
+                cycle, position = divmod(ordinal, size)
+                if cycle != current_cycle:
+                    permutation = KeyedPermutation(
+                        size, self._schedule_key(tenant, category, cycle)
+                    )
+                    current_cycle = cycle
+                quotes.append(state.quotes[indices[permutation[position]]])
+            calendar[tenant] = quotes
+        return calendar
+
+    @staticmethod
+    def _schedule_pool(state: _CorpusState, category: Optional[str]) -> Sequence[int]:
+        """Positions of the quotes eligible for scheduling."""
+        if category:
+            return state.category_index.get(fold(category), array("I"))
+        return range(len(state.quotes))
+
+    @staticmethod
+    def _schedule_size(indices: Sequence[int], pool_size: Optional[int]) -> int:
+        """Number of leading pool positions to schedule."""
+        if pool_size is None:
+            return len(indices)
+        if not 0 < pool_size <= len(indices):
+            raise ValueError(f"pool_size must be between 1 and {len(indices)}, got {pool_size}")
+        return pool_size
+
+    @staticmethod
+    def _schedule_key(tenant: str, category: Optional[str], cycle: int) -> bytes:
+        """Permutation key for a tenant, category and block of days."""
+        return schedule_key(tenant, fold(category) if category else None, cycle)
+
+    @instrumented
+    def get_quotes_by_length(self, min_length: Optional[int] = None,
+                             max_length: Optional[int] = None,
+                             category: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Get all quotes whose text length lies within a range.
+
+        Args:
+            min_length: Minimum length in characters (inclusive), or None.
+            max_length: Maximum length in characters (inclusive), or None.
+            category: Optional category filter.
+
+        Returns:
+            List of matching quotes, shortest first.
 
+        Example:
+            >>> generator = QuoteGenerator()
+            >>> push_friendly = generator.get_quotes_by_length(max_length=80)
+        """
+        state = self._state
+        positions = self._length_index_for(state, category).positions(min_length, max_length)
+        return [state.quotes[idx] for idx in positions]
+
+    @instrumented
+    def get_random_quote_by_length(self, min_length: Optional[int] = None,
+                                   max_length: Optional[int] = None,
+                                   category: Optional[str] = None,
+                                   seed: Optional[int] = None) -> Optional[Dict[str, str]]:
+        """
+        Get a random quote whose text length lies within a range.
+
+        Args:
+            min_length: Minimum length in characters (inclusive), or None.
+            max_length: Maximum length in characters (inclusive), or None.
+            category: Optional category filter.
+            seed: Optional seed making this call reproducible.
+
+        Returns:
+            A matching quote, or None if no quote fits the range.
+        """
+        state = self._state
+        idx = self._length_index_for(state, category).pick(
+            self.rng.for_call(seed), min_length, max_length
+        )
+        return None if idx is None else state.quotes[idx]
+
+    @instrumented
+    def get_longest_quotes(self, count: int, category: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Get the longest quotes.
+
+        Args:
+            count: Number of quotes to retrieve.
+            category: Optional category filter.
+
+        Returns:
+            Up to ``count`` quotes, longest first.
+        """
+        state = self._state
+        return [state.quotes[idx] for idx in self._length_index_for(state, category).longest(count)]
+
+    @instrumented
+    def get_shortest_quotes(self, count: int, category: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Get the shortest quotes.
+
+        Args:
+            count: Number of quotes to retrieve.
+            category: Optional category filter.
+
+        Returns:
+            Up to ``count`` quotes, shortest first.
+        """
+        state = self._state
+        return [state.quotes[idx] for idx in self._length_index_for(state, category).shortest(count)]
+
+    @instrumented
     def get_categories(self) -> Set[str]:
         """
         Get all available quote categories.
@@ -141,6 +765,7 @@ class QuoteGenerator:
         """
         return {q.get("category", "uncategorized") for q in self.quotes}
 
+    @instrumented
     def get_quotes_by_author(self, author: str) -> List[Dict[str, str]]:
         """
         Get all quotes by a specific author.
@@ -155,11 +780,10 @@ class QuoteGenerator:
             >>> generator = QuoteGenerator()
             >>> jobs_quotes = generator.get_quotes_by_author("Steve Jobs")
         """
-        return [
-            q for q in self.quotes 
-            if author.lower() in q.get("author", "").lower()
-        ]
+        state = self._state
+        return self._filter_by_key(state.quotes, state.author_keys, fold(author))
 
+    @instrumented
     def get_all_authors(self) -> Set[str]:
         """
         Get all unique authors in the collection.
@@ -169,6 +793,7 @@ class QuoteGenerator:
         """
         return {q.get("author", "Unknown") for q in self.quotes}
 
+    @instrumented
     def get_statistics(self) -> Dict[str, any]:
         """
         Get statistical information about the quote collection.
@@ -176,37 +801,107 @@ class QuoteGenerator:
         Returns:
             Dictionary containing various statistics.
         """
-        categories = [q.get("category", "uncategorized") for q in self.quotes]
-        authors = [q.get("author", "Unknown") for q in self.quotes]
+        quotes = self.quotes
+        categories = [q.get("category", "uncategorized") for q in quotes]
+        authors = [q.get("author", "Unknown") for q in quotes]
         
         category_counts = Counter(categories)
         author_counts = Counter(authors)
         
         return {
-            "total_quotes": len(self.quotes),
+            "total_quotes": len(quotes),
             "total_categories": len(set(categories)),
             "total_authors": len(set(authors)),
             "categories": dict(category_counts),
             "top_authors": dict(author_counts.most_common(5)),
-            "average_quote_length": sum(len(q.get("text", "")) for q in self.quotes) / len(self.quotes) if self.quotes else 0,
+            "average_quote_length": sum(len(q.get("text", "")) for q in quotes) / len(quotes) if quotes else 0,
         }
 
-    def search_quotes(self, keyword: str) -> List[Dict[str, str]]:
+    @instrumented
+    def search_quotes(self, keyword: str, fuzzy: bool = False,
+                      max_distance: int = 1) -> List[Dict[str, str]]:
         """
         Search for quotes containing a specific keyword.
         
         Args:
             keyword: Keyword to search for in quote text.
+            fuzzy: If True, match whole words allowing typos: every word of
+                the keyword must match a word of the quote within
+                ``max_distance`` edits. Results are ranked by total edit
+                distance, so exact word matches come first.
+            max_distance: Largest edit distance per word in fuzzy mode
+                (0 to 2).
             
         Returns:
             List of matching quotes.
+
+        Raises:
+            ValueError: If max_distance is out of range.
+        """
+        state = self._state
+        if not fuzzy:
+            return self._filter_by_key(state.quotes, state.text_keys, fold(keyword))
+        index = state.fuzzy_index
+        if index is None:
+            index = self._build_fuzzy_index(state)
+        return [state.quotes[idx] for idx in index.search(keyword, max_distance)]
+
+    @staticmethod
+    def _filter_by_key(quotes: Sequence[Dict[str, str]], keys: Sequence[str],
+                       needle: str) -> List[Dict[str, str]]:
+        """Quotes whose precomputed key contains the folded ``needle``."""
+        return [quote for quote, key in zip(quotes, keys) if needle in key]
+
+    @instrumented
+    def render_quotes(self, quotes: List[Dict[str, str]], fmt: str = "json") -> bytes:
+        """
+        Render quotes as a UTF-8 response body.
+
+        Each quote is encoded once and kept in ``response_cache`` (if
+        configured); responses are assembled by joining the cached buffers.
+
+        Args:
+            quotes: Quotes to render, typically returned by another method.
+            fmt: ``"json"`` for a JSON array, ``"text"`` for plain text or
+                ``"color"`` for ANSI-colored text, as produced by
+                ``format_quote``.
+
+        Returns:
+            Encoded response body.
+
+        Raises:
+            ValueError: If fmt is not a supported format.
+
+        Example:
+            >>> generator = QuoteGenerator(response_cache=ResponseCache())
+            >>> body = generator.render_quotes(generator.get_multiple_quotes(3))
         """
-        keyword_lower = keyword.lower()
-        return [
-            q for q in self.quotes 
-            if keyword_lower in q.get("text", "").lower()
-        ]
+        if fmt not in RENDER_FORMATS:
+            raise ValueError(f"Unsupported format {fmt!r}; expected one of {RENDER_FORMATS}")
+        cache = self.response_cache
+        if cache is None:
+            parts = [self._encode(quote, fmt) for quote in quotes]
+        else:
+            parts = cache.get_many(quotes, fmt)
+            for i, quote in enumerate(quotes):
+                if self.metrics is not None:
+                    self.metrics.record_cache("response_cache", parts[i] is not None)
+                if parts[i] is None:
+                    parts[i] = self._encode(quote, fmt)
+                    cache.put(quote, fmt, parts[i])
 
+        if fmt == "json":
+            return b"[" + b",".join(parts) + b"]"
+        return b"\n".join(parts)
+
+    @staticmethod
+    def _encode(quote: Dict[str, str], fmt: str) -> bytes:
+        """Serialize a single quote in one of ``RENDER_FORMATS``."""
+        if fmt == "json":
+            return json.dumps(dict(quote), ensure_ascii=False).encode("utf-8")
+        return format_quote(quote, no_color=(fmt == "text")).encode("utf-8")
+
+    @instrumented
     def export_quotes(self, output_file: str, category: Optional[str] = None) -> None:
         """
         Export quotes to a JSON file.
@@ -215,12 +910,13 @@ class QuoteGenerator:
             output_file: Path to output file.
             category: Optional category filter.
         """
-        quotes_to_export = self.quotes
+        state = self._state
+        quotes_to_export = state.quotes
         if category:
-            quotes_to_export = [
-                q for q in self.quotes 
-                if q.get("category", "").lower() == category.lower()
-            ]
+            quotes_to_export = self._category_quotes(state, category)
         
         with open(output_file, "w", encoding="utf-8") as f:
-            json.dump({"quotes": quotes_to_export}, f, indent=2, ensure_ascii=False)
+            json.dump(
+                {"quotes": [dict(q) for q in quotes_to_export]},
+                f, indent=2, ensure_ascii=False,
+            )
@@ -0,0 +1,117 @@
+"""
+Length-sorted secondary index for range and top-N queries.
+"""
+
+import bisect
+import random
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+
+class LengthIndex:
+    """
+    Quote positions sorted by text length.
+
+    Two parallel unsigned-int arrays hold the sorted lengths and the matching
+    positions in ``QuoteGenerator.quotes``; quotes of equal length keep
+    collection order.
+    Range bounds are found with ``bisect`` in O(log n).
+
+    Example:
+        >>> index = LengthIndex.build([(12, 0), (5, 1), (30, 2)])
+        >>> index.positions(max_length=20)
+        [1, 0]
+    """
+
+    def __init__(self):
+        self._lengths = array("I")
+        self._positions = array("I")
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[int, int]]) -> "LengthIndex":
+        """
+        Build an index from ``(length, position)`` pairs.
+
+        Args:
+            entries: Pairs in any order.
+
+        Returns:
+            The populated index.
+        """
+        index = cls()
+        for length, position in sorted(entries):
+            index._lengths.append(length)
+            index._positions.append(position)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def add(self, length: int, position: int) -> None:
+        """
+        Insert one quote, keeping the index sorted.
+
+        Args:
+            length: Text length of the quote.
+            position: Position of the quote in the collection. Must be
+                greater than every position already indexed.
+        """
+        slot = bisect.bisect_right(self._lengths, length)
+        self._lengths.insert(slot, length)
+        self._positions.insert(slot, position)
+
+    def bounds(self, min_length: Optional[int] = None,
+               max_length: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Find the slice of the index covering a length range.
+
+        Args:
+            min_length: Inclusive lower bound, or None for no bound.
+            max_length: Inclusive upper bound, or None for no bound.
+
+        Returns:
+            ``(start, stop)`` slice bounds; empty when ``start >= stop``.
+        """
+        start = 0 if min_length is None else bisect.bisect_left(self._lengths, min_length)
+        stop = len(self._lengths) if max_length is None else bisect.bisect_right(self._lengths, max_length)
+        return start, max(start, stop)
+
+    def count(self, min_length: Optional[int] = None,
+              max_length: Optional[int] = None) -> int:
+        """Number of quotes whose length lies in the range."""
+        start, stop = self.bounds(min_length, max_length)
+        return stop - start
+
+    def positions(self, min_length: Optional[int] = None,
+                  max_length: Optional[int] = None) -> List[int]:
+        """Positions of quotes in the range, shortest first."""
+        start, stop = self.bounds(min_length, max_length)
+        return self._positions[start:stop].tolist()
+
+    def pick(self, rng: random.Random, min_length: Optional[int] = None,
+             max_length: Optional[int] = None) -> Optional[int]:
+        """
+        Pick a uniformly random position within a length range.
+
+        Args:
+            rng: Random stream to draw from.
+            min_length: Inclusive lower bound, or None.
+            max_length: Inclusive upper bound, or None.
+
+        Returns:
+            A position, or None if the range is empty.
+        """
+        start, stop = self.bounds(min_length, max_length)
+        if start == stop:
+            return None
+        return self._positions[rng.randrange(start, stop)]
+
+    def shortest(self, count: int) -> List[int]:
+        """Positions of the ``count`` shortest quotes, shortest first."""
+        return self._positions[:max(0, count)].tolist()
+
+    def longest(self, count: int) -> List[int]:
+        """Positions of the ``count`` longest quotes, longest first."""
+        if count <= 0:
+            return []
+        return self._positions[:-count - 1:-1].tolist()
@@ -0,0 +1,285 @@
+"""
+Opt-in instrumentation and metrics export for the quotes generator.
+
+Instrumentation is disabled unless a ``Metrics`` instance is passed to
+``QuoteGenerator``. When disabled, every instrumented method costs a single
+attribute check on top of the original call.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial, wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Fixed HDR-style buckets on a 1-2-5 progression so histograms from
+# different processes can be merged bucket-by-bucket.
+LATENCY_BUCKETS: Tuple[float, ...] = tuple(
+    m * 10.0 ** e for e in range(-6, 1) for m in (1, 2, 5)
+) + (10.0,)
+SIZE_BUCKETS: Tuple[float, ...] = tuple(
+    m * 10 ** e for e in range(0, 6) for m in (1, 2, 5)
+) + (1000000,)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    Attributes:
+        bounds (Tuple[float, ...]): Inclusive upper bounds of each bucket.
+        counts (List[int]): Observations per bucket; the last slot is +Inf.
+        total (float): Sum of all observed values.
+        count (int): Number of observations.
+    """
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts: List[int] = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the histogram as a plain dictionary."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": dict(zip(self.bounds + (float("inf"),), self.counts)),
+        }
+
+
+class Metrics:
+    """
+    Thread-safe collector for call counts, latencies, result sizes and
+    cache hit rates.
+
+    Example:
+        >>> metrics = Metrics()
+        >>> generator = QuoteGenerator(metrics=metrics)
+        >>> generator.get_random_quote()
+        >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._latency: Dict[str, Histogram] = {}
+        self._sizes: Dict[str, Histogram] = {}
+        self._cache: Dict[str, List[int]] = {}
+
+    def observe(self, name: str, seconds: float, size: Optional[int] = None) -> None:
+        """
+        Record one completed call.
+
+        Args:
+            name: Operation name.
+            seconds: Wall-clock duration of the call.
+            size: Optional result size (number of quotes returned).
+        """
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + 1
+            latency = self._latency.get(name)
+            if latency is None:
+                latency = self._latency[name] = Histogram(LATENCY_BUCKETS)
+            latency.observe(seconds)
+            if size is not None:
+                sizes = self._sizes.get(name)
+                if sizes is None:
+                    sizes = self._sizes[name] = Histogram(SIZE_BUCKETS)
+                sizes.observe(size)
+
+    def record_error(self, name: str) -> None:
+        """Record a call that raised an exception."""
+        with self._lock:
+            self._errors[name] = self._errors.get(name, 0) + 1
+
+    def record_cache(self, name: str, hit: bool) -> None:
+        """
+        Record a cache lookup.
+
+        Args:
+            name: Cache name.
+            hit: Whether the lookup was served from the cache.
+        """
+        with self._lock:
+            entry = self._cache.get(name)
+            if entry is None:
+                entry = self._cache[name] = [0, 0]
+            entry[0 if hit else 1] += 1
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """Context manager that records the duration of its body."""
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.record_error(name)
+            raise
+        self.observe(name, time.perf_counter() - start)
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """
+        Wrap a plain function so every call is recorded under ``name``.
+
+        Args:
+            name: Operation name.
+            func: Function to wrap.
+
+        Returns:
+            The instrumented function.
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                self.record_error(name)
+                raise
+            self.observe(name, time.perf_counter() - start, _result_size(result))
+            return result
+
+        return wrapper
+
+    def reset(self) -> None:
+        """Discard all recorded data."""
+        with self._lock:
+            self._calls.clear()
+            self._errors.clear()
+            self._latency.clear()
+            self._sizes.clear()
+            self._cache.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a point-in-time copy of all recorded metrics.
+
+        Returns:
+            Dictionary with ``operations`` (per-operation calls, errors,
+            latency and result-size histograms) and ``caches`` (hits,
+            misses and hit rate per cache).
+        """
+        with self._lock:
+            operations = {}
+            for name in sorted(set(self._calls) | set(self._errors)):
+                entry = {
+                    "calls": self._calls.get(name, 0),
+                    "errors": self._errors.get(name, 0),
+                }
+                if name in self._latency:
+                    entry["latency"] = self._latency[name].snapshot()
+                if name in self._sizes:
+                    entry["result_size"] = self._sizes[name].snapshot()
+                operations[name] = entry
+
+            caches = {}
+            for name, (hits, misses) in sorted(self._cache.items()):
+                lookups = hits + misses
+                caches[name] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / lookups if lookups else 0.0,
+                }
+
+        return {"operations": operations, "caches": caches}
+
+    def to_prometheus(self, prefix: str = "quotes_generator") -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix.
+
+        Returns:
+            Exposition text, terminated by a newline.
+        """
+        snap = self.snapshot()
+        lines: List[str] = []
+
+        lines.append(f"# TYPE {prefix}_calls_total counter")
+        for name, entry in snap["operations"].items():
+            lines.append(f'{prefix}_calls_total{{operation="{name}"}} {entry["calls"]}')
+
+        lines.append(f"# TYPE {prefix}_errors_total counter")
+        for name, entry in snap["operations"].items():
+            lines.append(f'{prefix}_errors_total{{operation="{name}"}} {entry["errors"]}')
+
+        for metric, key in (("latency_seconds", "latency"), ("result_size", "result_size")):
+            lines.append(f"# TYPE {prefix}_{metric} histogram")
+            for name, entry in snap["operations"].items():
+                if key in entry:
+                    lines.extend(_histogram_lines(f"{prefix}_{metric}", name, entry[key]))
+
+        lines.append(f"# TYPE {prefix}_cache_hits_total counter")
+        for name, entry in snap["caches"].items():
+            lines.append(f'{prefix}_cache_hits_total{{cache="{name}"}} {entry["hits"]}')
+        lines.append(f"# TYPE {prefix}_cache_misses_total counter")
+        for name, entry in snap["caches"].items():
+            lines.append(f'{prefix}_cache_misses_total{{cache="{name}"}} {entry["misses"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(metric: str, operation: str, hist: Dict[str, Any]) -> List[str]:
+    """Render one histogram as cumulative Prometheus bucket lines."""
+    lines = []
+    cumulative = 0
+    for bound, count in hist["buckets"].items():
+        cumulative += count
+        le = "+Inf" if bound == float("inf") else f"{bound:g}"
+        lines.append(f'{metric}_bucket{{operation="{operation}",le="{le}"}} {cumulative}')
+    lines.append(f'{metric}_sum{{operation="{operation}"}} {hist["sum"]:g}')
+    lines.append(f'{metric}_count{{operation="{operation}"}} {hist["count"]}')
+    return lines
+
+
+def _result_size(result: Any) -> int:
+    """Number of quotes in a result: 0 for None, len() for collections, else 1."""
+    if result is None:
+        return 0
+    if isinstance(result, (list, set, tuple, frozenset)):
+        return len(result)
+    return 1
+
+
+def instrumented(func: Optional[Callable] = None, *,
+                 size: Callable[[Any], int] = _result_size) -> Callable:
+    """
+    Decorator for ``QuoteGenerator`` methods.
+
+    Records the call in ``self.metrics`` when instrumentation is enabled;
+    otherwise calls straight through. Use ``@instrumented(size=...)`` for
+    methods whose result is not a quote or a collection of quotes.
+
+    Args:
+        func: Method to wrap.
+        size: Function giving the result size recorded for a call.
+    """
+    if func is None:
+        return partial(instrumented, size=size)
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        metrics = self.metrics
+        if metrics is None:
+            return func(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            result = func(self, *args, **kwargs)
+        except BaseException:
+            metrics.record_error(name)
+            raise
+        metrics.observe(name, time.perf_counter() - start, size(result))
+        return result
+
+    return wrapper
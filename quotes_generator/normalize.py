@@ -0,0 +1,122 @@
+"""
+Load-time validation and normalization of quote records.
+
+Every record is checked in one pass and all problems are reported together.
+Required fields are stripped of surrounding whitespace, and case-insensitive
+comparison keys are computed once here instead of on every query.
+"""
+
+import unicodedata
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+REQUIRED_FIELDS = ("text", "author", "category")
+
+# Problems listed in the error message; the rest are only counted.
+MAX_REPORTED_ERRORS = 20
+
+
+def fold(value: str) -> str:
+    """
+    Comparison key for case-insensitive matching.
+
+    Applies NFKC normalization, so compatibility forms such as ligatures and
+    full-width letters match their plain equivalents, then case folding,
+    which also handles characters like ``ß`` that ``lower()`` leaves alone.
+
+    Args:
+        value: String to fold.
+
+    Returns:
+        The folded key.
+    """
+    return unicodedata.normalize("NFKC", value).casefold()
+
+
+def check_quote(quote: Any) -> Optional[str]:
+    """
+    Validate one record and strip its required fields in place.
+
+    Args:
+        quote: Record as parsed from JSON.
+
+    Returns:
+        A description of the first problem found (e.g. ``"is missing
+        required fields: author"``), or None if the record is valid.
+    """
+    if not isinstance(quote, dict):
+        return f"is not an object but {type(quote).__name__}"
+    missing = [field for field in REQUIRED_FIELDS if field not in quote]
+    if missing:
+        return f"is missing required fields: {', '.join(missing)}"
+    for field in REQUIRED_FIELDS:
+        value = quote[field]
+        if not isinstance(value, str):
+            return f"has a non-string {field!r}"
+        value = value.strip()
+        if not value:
+            return f"has an empty {field!r}"
+        quote[field] = value
+    return None
+
+
+def normalize_quotes(quotes: List[Any], text_keys: bool = True) -> Tuple[List[Dict[str, str]], List[str]]:
+    """
+    Validate and normalize a collection of records in place.
+
+    Args:
+        quotes: Records as parsed from JSON.
+        text_keys: Whether to compute folded text keys.
+
+    Returns:
+        ``(quotes, text_keys)``; ``text_keys`` is empty when not requested.
+
+    Raises:
+        ValueError: Listing every invalid record, if there are any.
+    """
+    keys: List[str] = []
+    errors: List[str] = []
+    for idx, quote in enumerate(quotes):
+        problem = check_quote(quote)
+        if problem is not None:
+            errors.append(f"Quote at index {idx} {problem}")
+        elif text_keys:
+            keys.append(fold(quote["text"]))
+    if errors:
+        raise ValueError(_format_errors(errors))
+    return quotes, keys
+
+
+def _format_errors(errors: List[str]) -> str:
+    lines = [f"{len(errors)} invalid quote(s):"]
+    lines.extend(errors[:MAX_REPORTED_ERRORS])
+    if len(errors) > MAX_REPORTED_ERRORS:
+        lines.append(f"... and {len(errors) - MAX_REPORTED_ERRORS} more")
+    return "\n".join(lines)
+
+
+class FoldedField(Sequence):
+    """
+    Read-only sequence of folded keys for one field, computed on access.
+
+    Stands in for a precomputed key list where keeping one would defeat the
+    purpose, e.g. for text held in compressed storage.
+    """
+
+    def __init__(self, quotes: Sequence[Mapping[str, Any]], field: str):
+        """
+        Initialize the view.
+
+        Args:
+            quotes: Quotes to read from.
+            field: Field to fold.
+        """
+        self._quotes = quotes
+        self._field = field
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [fold(quote[self._field]) for quote in self._quotes[idx]]
+        return fold(self._quotes[idx][self._field])
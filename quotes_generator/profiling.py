@@ -0,0 +1,331 @@
+"""
+Built-in profiling for the quotes generator.
+
+``Profiler`` runs a block of code under cProfile and tracemalloc. Load
+phases decorated with ``phase`` (``_load_quotes``, ``_validate_quotes`` and
+index builds) additionally get their own timing and allocation report.
+
+cProfile hooks a single thread, so a profiler only sees the thread that
+entered it; phases run on other threads are not recorded.
+"""
+
+import cProfile
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Profiler collecting phase data on each thread, in ``_local.active``.
+_local = threading.local()
+
+_FuncKey = Tuple[str, int, str]
+
+# Allocations made by the profiling machinery itself are not reported.
+_IGNORED_FILES = {tracemalloc.__file__, __file__, contextmanager.__code__.co_filename}
+
+
+class PhaseStats:
+    """
+    Timing and allocation data for a single load phase.
+
+    Attributes:
+        name (str): Phase name.
+        seconds (float): Wall-clock duration.
+        allocated (int): Net bytes allocated and still alive after the phase.
+        peak (Optional[int]): Peak traced memory during the phase, or None
+            when tracemalloc cannot reset its peak (Python < 3.9).
+        top_sites (List[Tuple[str, int, int]]): Allocation sites as
+            ``(location, bytes, blocks)``, largest first.
+    """
+
+    def __init__(self, name: str, seconds: float, allocated: int,
+                 peak: Optional[int], top_sites: List[Tuple[str, int, int]]):
+        self.name = name
+        self.seconds = seconds
+        self.allocated = allocated
+        self.peak = peak
+        self.top_sites = top_sites
+
+
+class ProfileReport:
+    """
+    Results of a profiling session.
+
+    Attributes:
+        stats (pstats.Stats): cProfile statistics.
+        seconds (float): Wall-clock duration of the session.
+        peak_memory (int): Peak traced memory in bytes over the whole
+            session, including time spent outside phases.
+        phases (List[PhaseStats]): Per-phase data in execution order.
+    """
+
+    def __init__(self, stats: pstats.Stats, seconds: float, peak_memory: int,
+                 phases: List[PhaseStats]):
+        self.stats = stats
+        self.seconds = seconds
+        self.peak_memory = peak_memory
+        self.phases = phases
+
+    def top_functions(self, limit: int = 10) -> List[Tuple[str, int, float, float]]:
+        """
+        Get the most expensive functions by cumulative time.
+
+        Args:
+            limit: Maximum number of functions to return.
+
+        Returns:
+            List of ``(function, calls, tottime, cumtime)`` tuples.
+        """
+        rows = [
+            (_label(func), nc, tt, ct)
+            for func, (cc, nc, tt, ct, callers) in self.stats.stats.items()
+        ]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows[:limit]
+
+    def format(self, limit: int = 10) -> str:
+        """
+        Format the report for display.
+
+        Args:
+            limit: Number of functions and allocation sites to show.
+
+        Returns:
+            Human-readable report.
+        """
+        lines = [
+            f"Profile: {self.seconds:.4f}s total, "
+            f"peak memory {_format_bytes(self.peak_memory)}",
+        ]
+
+        if self.phases:
+            lines.append("\nLoad phases:")
+            for phase in self.phases:
+                peak = f", peak {_format_bytes(phase.peak)}" if phase.peak is not None else ""
+                lines.append(
+                    f"  {phase.name}: {phase.seconds:.4f}s, "
+                    f"{_format_bytes(phase.allocated)} retained{peak}"
+                )
+                for location, size, blocks in phase.top_sites[:limit]:
+                    lines.append(f"      {location}: {_format_bytes(size)} in {blocks} blocks")
+
+        lines.append("\nTop functions by cumulative time:")
+        lines.append(f"  {'calls':>8}  {'tottime':>9}  {'cumtime':>9}  function")
+        for name, calls, tottime, cumtime in self.top_functions(limit):
+            lines.append(f"  {calls:>8}  {tottime:>9.6f}  {cumtime:>9.6f}  {name}")
+
+        lines.append("")
+        return "\n".join(lines)
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Write cProfile data in pstats format.
+
+        Args:
+            path: Output file path.
+        """
+        self.stats.dump_stats(path)
+
+    def write_collapsed(self, path: str) -> None:
+        """
+        Write flamegraph-compatible collapsed stacks.
+
+        cProfile only records caller/callee pairs, so each function's own
+        time is attributed to the stack formed by repeatedly following its
+        most expensive caller.
+
+        Args:
+            path: Output file path.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, micros in sorted(self.collapsed_stacks().items()):
+                f.write(f"{stack} {micros}\n")
+
+    def collapsed_stacks(self) -> Dict[str, int]:
+        """
+        Build collapsed stacks from the cProfile caller graph.
+
+        Returns:
+            Mapping of ``;``-joined stacks (root first) to self time in
+            microseconds.
+        """
+        entries = self.stats.stats
+        stacks: Dict[str, int] = {}
+        for func, (cc, nc, tt, ct, callers) in entries.items():
+            micros = int(tt * 1e6)
+            if micros <= 0:
+                continue
+            chain = [func]
+            seen = {func}
+            current = callers
+            while current:
+                caller = max(current, key=lambda c: current[c][3])
+                if caller in seen:
+                    break
+                chain.append(caller)
+                seen.add(caller)
+                current = entries[caller][4] if caller in entries else {}
+            stack = ";".join(_label(f).replace(";", ",") for f in reversed(chain))
+            stacks[stack] = stacks.get(stack, 0) + micros
+        return stacks
+
+
+class Profiler:
+    """
+    Context manager that profiles its body with cProfile and tracemalloc.
+
+    Example:
+        >>> with Profiler() as profiler:
+        ...     generator = QuoteGenerator()
+        ...     generator.search_quotes("success")
+        >>> print(profiler.report.format())
+    """
+
+    def __init__(self, memory: bool = True, top_sites: int = 10):
+        """
+        Initialize the profiler.
+
+        Args:
+            memory: If True, trace allocations with tracemalloc.
+            top_sites: Number of allocation sites kept per phase.
+        """
+        self.memory = memory
+        self.top_sites = top_sites
+        self.report: Optional[ProfileReport] = None
+        self._profile = cProfile.Profile()
+        self._phases: List[PhaseStats] = []
+        self._started_tracing = False
+        # Peak traced memory folded in before each phase resets it.
+        self._peak = 0
+        self._previous: Optional[Profiler] = None
+        # Thread cProfile is enabled on while the block runs.
+        self._thread: Optional[int] = None
+        self._start = 0.0
+
+    def __enter__(self) -> "Profiler":
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._previous = getattr(_local, "active", None)
+        _local.active = self
+        self._thread = threading.get_ident()
+        self._start = time.perf_counter()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._profile.disable()
+        seconds = time.perf_counter() - self._start
+        _local.active = self._previous
+        self._thread = None
+
+        peak = 0
+        if tracemalloc.is_tracing():
+            peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            if self._started_tracing:
+                tracemalloc.stop()
+
+        self.report = ProfileReport(
+            pstats.Stats(self._profile), seconds, peak, self._phases
+        )
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Record timing and allocations for a named phase.
+
+        The tracemalloc peak is reset at the start of the phase, so a
+        caller reading ``tracemalloc.get_traced_memory()`` directly sees
+        only the peak since the last phase; ``ProfileReport.peak_memory``
+        keeps the session maximum.
+
+        Args:
+            name: Phase name.
+        """
+        tracing = tracemalloc.is_tracing()
+        can_reset = hasattr(tracemalloc, "reset_peak")
+        with self._paused():
+            before = tracemalloc.take_snapshot() if tracing else None
+            if tracing and can_reset:
+                self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+                tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            with self._paused():
+                allocated, peak, sites = 0, None, []
+                if before is not None:
+                    if can_reset:
+                        peak = tracemalloc.get_traced_memory()[1]
+                    diff = tracemalloc.take_snapshot().compare_to(before, "lineno")
+                    for stat in diff:
+                        frame = stat.traceback[0]
+                        if frame.filename in _IGNORED_FILES:
+                            continue
+                        allocated += stat.size_diff
+                        if stat.size_diff > 0 and len(sites) < self.top_sites:
+                            sites.append(
+                                (f"{frame.filename}:{frame.lineno}", stat.size_diff, stat.count_diff)
+                            )
+                self._phases.append(PhaseStats(name, seconds, allocated, peak, sites))
+
+    @contextmanager
+    def _paused(self) -> Iterator[None]:
+        """
+        Suspend cProfile so profiler bookkeeping is not charged to the profile.
+
+        Does nothing on threads other than the profiled one, where enabling
+        cProfile afterwards would install it on that thread.
+        """
+        if threading.get_ident() != self._thread:
+            yield
+            return
+        self._profile.disable()
+        try:
+            yield
+        finally:
+            self._profile.enable()
+
+
+def phase(func: Callable) -> Callable:
+    """
+    Decorator marking a load phase for per-phase profiling.
+
+    Calls straight through unless a ``Profiler`` is active on the calling
+    thread.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = getattr(_local, "active", None)
+        if profiler is None:
+            return func(*args, **kwargs)
+        with profiler.phase(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _label(func: _FuncKey) -> str:
+    """Readable name for a pstats function key."""
+    filename, lineno, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+def _format_bytes(size: int) -> str:
+    """Format a byte count with a binary unit."""
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
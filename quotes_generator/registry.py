@@ -0,0 +1,290 @@
+"""
+Registry of quote corpora loaded on demand.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, Set, Union
+
+from .generator import QuoteGenerator
+
+
+class _CorpusStats:
+    """Per-file load and hit counters, kept across evictions."""
+
+    __slots__ = ("loads", "hits", "coalesced", "evictions")
+
+    def __init__(self):
+        self.loads = 0
+        self.hits = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+
+class CorpusRegistry:
+    """
+    Load quote corpora on demand and keep them within a memory budget.
+
+    All corpora share one author/category string table, so a name that
+    appears in many tenant files is stored once. Entries are reference
+    counted per corpus and dropped with the last corpus using them, and the
+    table counts towards the memory budget. Concurrent requests for a
+    corpus that is not loaded yet wait for a single parse instead of each
+    parsing the file. When the estimated memory of all loaded corpora and
+    the string table exceeds ``max_bytes``, the least recently used corpora
+    are evicted.
+
+    Example:
+        >>> registry = CorpusRegistry(max_bytes=64 * 1024 * 1024)
+        >>> generator = registry.get("tenants/acme.json")
+        >>> quote = generator.get_random_quote()
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, **generator_options: Any):
+        """
+        Initialize the registry.
+
+        Args:
+            max_bytes: Memory budget for all loaded corpora.
+            generator_options: Keyword arguments passed to every
+                ``QuoteGenerator`` (e.g. ``compress_text=True``).
+
+        Raises:
+            ValueError: If max_bytes is not positive or ``strings`` is given.
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        if "strings" in generator_options:
+            raise ValueError("The registry manages the shared string table itself")
+        self.max_bytes = max_bytes
+        self.generator_options = generator_options
+        self._strings: Dict[str, str] = {}
+        self._refs: Dict[str, int] = {}
+        self._string_bytes = 0
+        self._corpus_strings: Dict[Path, Set[str]] = {}
+        self._corpora: "OrderedDict[Path, QuoteGenerator]" = OrderedDict()
+        self._sizes: Dict[Path, int] = {}
+        self._loading: Dict[Path, Future] = {}
+        self._stats: Dict[Path, _CorpusStats] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._corpora)
+
+    def __contains__(self, quotes_file: Union[str, Path]) -> bool:
+        return self._key(quotes_file) in self._corpora
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated memory of all loaded corpora and the string table."""
+        return sum(self._sizes.values()) + self._table_bytes()
+
+    def get(self, quotes_file: Union[str, Path]) -> QuoteGenerator:
+        """
+        Get the generator for a quotes file, loading it if needed.
+
+        Args:
+            quotes_file: Path to the quotes JSON file.
+
+        Returns:
+            The shared generator for that file.
+
+        Raises:
+            FileNotFoundError: If the quotes file doesn't exist.
+            ValueError: If the quotes file is invalid.
+        """
+        key = self._key(quotes_file)
+        with self._lock:
+            stats = self._stats.setdefault(key, _CorpusStats())
+            generator = self._corpora.get(key)
+            if generator is not None:
+                self._corpora.move_to_end(key)
+                stats.hits += 1
+                self._record_cache(True)
+                return generator
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = self._loading[key] = Future()
+                stats.loads += 1
+            else:
+                stats.coalesced += 1
+            self._record_cache(False)
+
+        if not owner:
+            return future.result()
+
+        try:
+            generator = QuoteGenerator(key, strings=self._strings, **self.generator_options)
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+
+        size = estimate_size(generator)
+        strings = _table_strings(generator)
+        with self._lock:
+            del self._loading[key]
+            self._corpora[key] = generator
+            self._sizes[key] = size + sys.getsizeof(strings)
+            self._acquire(key, strings)
+            self._evict(keep=key)
+        future.set_result(generator)
+        return generator
+
+    def evict(self, quotes_file: Union[str, Path]) -> bool:
+        """
+        Drop a corpus from the registry.
+
+        Args:
+            quotes_file: Path to the quotes JSON file.
+
+        Returns:
+            True if the corpus was loaded.
+        """
+        key = self._key(quotes_file)
+        with self._lock:
+            if key not in self._corpora:
+                return False
+            self._drop(key)
+            return True
+
+    def clear(self) -> None:
+        """Drop every corpus. Statistics are kept."""
+        with self._lock:
+            for key in list(self._corpora):
+                self._drop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with ``total_bytes``, ``max_bytes``, ``shared_strings``,
+            ``string_bytes`` (the estimated memory of the string table,
+            included in ``total_bytes``) and ``corpora``, which maps each
+            file ever requested to its
+            ``loaded`` flag, estimated ``bytes``, ``quotes`` count and
+            ``loads``, ``hits``, ``coalesced`` and ``evictions`` counters.
+        """
+        with self._lock:
+            corpora = {}
+            for key, stats in self._stats.items():
+                generator = self._corpora.get(key)
+                corpora[str(key)] = {
+                    "loaded": generator is not None,
+                    "bytes": self._sizes.get(key, 0),
+                    "quotes": len(generator.quotes) if generator is not None else 0,
+                    "loads": stats.loads,
+                    "hits": stats.hits,
+                    "coalesced": stats.coalesced,
+                    "evictions": stats.evictions,
+                }
+            return {
+                "total_bytes": sum(self._sizes.values()) + self._table_bytes(),
+                "max_bytes": self.max_bytes,
+                "shared_strings": len(self._strings),
+                "string_bytes": self._table_bytes(),
+                "corpora": corpora,
+            }
+
+    def _evict(self, keep: Path) -> None:
+        """Evict least recently used corpora until within budget."""
+        while sum(self._sizes.values()) + self._table_bytes() > self.max_bytes:
+            oldest = next(iter(self._corpora))
+            if oldest == keep:
+                break
+            self._drop(oldest)
+
+    def _drop(self, key: Path) -> None:
+        generator = self._corpora.pop(key)
+        del self._sizes[key]
+        self._release(key, generator)
+        self._stats[key].evictions += 1
+
+    def _acquire(self, key: Path, strings: Set[str]) -> None:
+        """Count a new corpus's references to the string table."""
+        table, refs = self._strings, self._refs
+        for string in strings:
+            count = refs.get(string, 0)
+            if not count:
+                # May have been released while this corpus was loading.
+                table.setdefault(string, string)
+                self._string_bytes += sys.getsizeof(string)
+            refs[string] = count + 1
+        self._corpus_strings[key] = strings
+
+    def _release(self, key: Path, generator: QuoteGenerator) -> None:
+        """Drop a corpus's references and the table entries left unused."""
+        table, refs = self._strings, self._refs
+        # Strings added after loading (add_quote) were never counted.
+        for string in self._corpus_strings.pop(key) | _table_strings(generator):
+            count = refs.pop(string, 0) - 1
+            if count > 0:
+                refs[string] = count
+            elif table.pop(string, None) is not None and count == 0:
+                self._string_bytes -= sys.getsizeof(string)
+
+    def _table_bytes(self) -> int:
+        """Estimated memory of the string table and its reference counts."""
+        return sys.getsizeof(self._strings) + sys.getsizeof(self._refs) + self._string_bytes
+
+    def _record_cache(self, hit: bool) -> None:
+        metrics = self.generator_options.get("metrics")
+        if metrics is not None:
+            metrics.record_cache("corpus_registry", hit)
+
+    @staticmethod
+    def _key(quotes_file: Union[str, Path]) -> Path:
+        return Path(quotes_file).resolve()
+
+
+def _table_strings(generator: QuoteGenerator) -> Set[str]:
+    """
+    Strings a generator takes from its string table.
+
+    Every author and category goes through ``_fold_key``, so the raw
+    strings and their folded keys are exactly the entries of its folded-key
+    cache.
+    """
+    folded = generator._state.folded
+    return set(folded) | set(folded.values())
+
+
+def estimate_size(generator: QuoteGenerator) -> int:
+    """
+    Estimate the memory held by one generator's corpus.
+
+    Counts the quote objects, their text (or the compressed store), the
+    folded search keys and the position indexes. Shared author and category
+    strings and their keys are excluded since they belong to the registry's
+    string table.
+
+    Args:
+        generator: Loaded generator.
+
+    Returns:
+        Approximate size in bytes.
+    """
+    state = generator._state
+    size = sys.getsizeof(state.quotes)
+    store = state.text_store
+    for quote in state.quotes:
+        size += sys.getsizeof(quote)
+        if store is None:
+            size += sys.getsizeof(quote["text"])
+    if store is not None:
+        size += store.compressed_bytes
+    size += sys.getsizeof(state.author_keys)
+    if isinstance(state.text_keys, list):
+        size += sys.getsizeof(state.text_keys)
+        size += sum(sys.getsizeof(key) for key in state.text_keys)
+    for positions in state.category_index.values():
+        size += sys.getsizeof(positions)
+    for index in [state.length_index, *state.category_length_index.values()]:
+        size += 8 * len(index)
+    return size
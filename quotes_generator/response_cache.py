@@ -0,0 +1,146 @@
+"""
+Pre-serialized response cache for JSON and rendered-text outputs.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Approximate per-entry bookkeeping cost (key tuple, dict slot, bytes header).
+_ENTRY_OVERHEAD = 160
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of encoded buffers, bounded by total size.
+
+    Each entry keeps a reference to the object it was rendered from, so an
+    entry can never be served for a different object that happens to reuse
+    the same ``id()``.
+
+    Attributes:
+        max_bytes (int): Upper bound on the memory used by cached entries.
+        size_bytes (int): Current estimated memory use.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that had to render.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Memory bound in bytes.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[int, Hashable], Tuple[Any, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, obj: Any, variant: Hashable) -> Optional[bytes]:
+        """
+        Look up the cached buffer for an object and format variant.
+
+        Args:
+            obj: Object the buffer was rendered from.
+            variant: Format variant.
+
+        Returns:
+            The cached buffer, or None on a miss.
+        """
+        key = (id(obj), variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not obj:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_many(self, objs: Sequence[Any], variant: Hashable) -> List[Optional[bytes]]:
+        """
+        Look up several objects under a single lock acquisition.
+
+        Args:
+            objs: Objects the buffers were rendered from.
+            variant: Format variant.
+
+        Returns:
+            One buffer per object, None where it was not cached.
+        """
+        results: List[Optional[bytes]] = []
+        entries = self._entries
+        with self._lock:
+            for obj in objs:
+                key = (id(obj), variant)
+                entry = entries.get(key)
+                if entry is None or entry[0] is not obj:
+                    results.append(None)
+                    continue
+                entries.move_to_end(key)
+                results.append(entry[1])
+            hits = len(results) - results.count(None)
+            self.hits += hits
+            self.misses += len(results) - hits
+        return results
+
+    def put(self, obj: Any, variant: Hashable, data: bytes) -> None:
+        """
+        Store a buffer, evicting least-recently-used entries to stay in bounds.
+
+        Buffers larger than ``max_bytes`` are not cached.
+
+        Args:
+            obj: Object the buffer was rendered from.
+            variant: Format variant.
+            data: Encoded buffer.
+        """
+        cost = len(data) + _ENTRY_OVERHEAD
+        if cost > self.max_bytes:
+            return
+        key = (id(obj), variant)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size_bytes -= len(old[1]) + _ENTRY_OVERHEAD
+            while self._entries and self.size_bytes + cost > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted) + _ENTRY_OVERHEAD
+            self._entries[key] = (obj, data)
+            self.size_bytes += cost
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after the corpus changes."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entries, size_bytes, max_bytes, hits, misses and
+            hit_rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,203 @@
+"""
+Sampling without replacement over position arrays.
+"""
+
+import random
+from array import array
+from typing import Dict, Hashable, List, Optional, Sequence
+
+
+class SparseShuffle:
+    """
+    Draw items of a sequence in random order without copying it.
+
+    A Fisher-Yates shuffle run lazily: only swapped slots are recorded in a
+    dictionary, so each draw costs O(1) time and memory regardless of the
+    sequence length.
+
+    Example:
+        >>> shuffle = SparseShuffle(range(1000000), random.Random(0))
+        >>> first, second = shuffle.draw(), shuffle.draw()
+        >>> first != second
+        True
+    """
+
+    __slots__ = ("_items", "_rng", "_remaining", "_swaps")
+
+    def __init__(self, items: Sequence[int], rng: random.Random):
+        """
+        Initialize the shuffle.
+
+        Args:
+            items: Sequence to draw from, e.g. an index array. Not modified.
+            rng: Random stream to draw with.
+        """
+        self._items = items
+        self._rng = rng
+        self._remaining = len(items)
+        self._swaps: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return self._remaining
+
+    def draw(self) -> int:
+        """
+        Draw one item not drawn before.
+
+        Raises:
+            IndexError: If every item has been drawn.
+        """
+        if not self._remaining:
+            raise IndexError("draw from an exhausted shuffle")
+        swaps = self._swaps
+        slot = self._rng.randrange(self._remaining)
+        last = self._remaining - 1
+        item = swaps.get(slot)
+        if item is None:
+            item = self._items[slot]
+        moved = swaps.pop(last, None)
+        if slot != last:
+            swaps[slot] = moved if moved is not None else self._items[last]
+        self._remaining = last
+        return item
+
+
+class PositionGroups:
+    """
+    Positions grouped by key, e.g. the quotes of each author.
+
+    Groups are kept in a list in order of first appearance, so a group can
+    be picked by slot in O(1).
+
+    Attributes:
+        keys (List[Hashable]): Key of each group.
+        groups (List[array]): Positions of each group, in insertion order.
+    """
+
+    __slots__ = ("keys", "groups", "_slots")
+
+    def __init__(self):
+        self.keys: List[Hashable] = []
+        self.groups: List[array] = []
+        self._slots: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def add(self, key: Hashable, position: int) -> None:
+        """
+        Append a position to the group of a key.
+
+        Args:
+            key: Group key.
+            position: Position to append.
+        """
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = len(self.groups)
+            self.keys.append(key)
+            self.groups.append(array("I"))
+        self.groups[slot].append(position)
+
+
+class _CappedDraw:
+    """
+    Draw items of one stratum, at most ``cap`` per group key.
+
+    A group is picked uniformly among those still open, then an item from
+    it with its own ``SparseShuffle``. Groups are closed when they run out
+    or their key reaches the cap, which can happen at most once per group
+    touched, so a draw costs O(1) amortized.
+    """
+
+    __slots__ = ("_groups", "_rng", "_cap", "_taken", "_open", "_swaps", "_shuffles")
+
+    def __init__(self, groups: PositionGroups, rng: random.Random, cap: int,
+                 taken: Dict[Hashable, int]):
+        self._groups = groups
+        self._rng = rng
+        self._cap = cap
+        self._taken = taken
+        self._open = len(groups)
+        self._swaps: Dict[int, int] = {}
+        self._shuffles: Dict[int, SparseShuffle] = {}
+
+    def __len__(self) -> int:
+        return self._open
+
+    def draw(self) -> Optional[int]:
+        """Draw one item, or return None if every open group is capped."""
+        keys, taken, swaps = self._groups.keys, self._taken, self._swaps
+        while self._open:
+            index = self._rng.randrange(self._open)
+            slot = swaps.get(index, index)
+            key = keys[slot]
+            if taken.get(key, 0) >= self._cap:
+                self._close(index)
+                continue
+            shuffle = self._shuffles.get(slot)
+            if shuffle is None:
+                shuffle = self._shuffles[slot] = SparseShuffle(self._groups.groups[slot], self._rng)
+            item = shuffle.draw()
+            taken[key] = taken.get(key, 0) + 1
+            if not len(shuffle) or taken[key] >= self._cap:
+                self._close(index)
+            return item
+        return None
+
+    def _close(self, index: int) -> None:
+        """Remove the group at ``index`` of the open range by moving the last one there."""
+        swaps = self._swaps
+        last = self._open - 1
+        moved = swaps.pop(last, last)
+        if index != last:
+            swaps[index] = moved
+        self._open = last
+
+
+def stratified_sample(strata: Sequence, count: int, rng: random.Random,
+                      max_per_group: Optional[int] = None) -> List[int]:
+    """
+    Draw distinct items spread evenly over strata.
+
+    Strata are visited round-robin in a random order, drawing one item from
+    each per round, so the counts taken from any two strata differ by at
+    most one unless a stratum runs out. Without a cap every item of a
+    stratum is equally likely. With ``max_per_group``, each stratum is a
+    ``PositionGroups``; a group whose key is still under the cap is picked
+    uniformly, then one of its items, so items of large groups are less
+    likely than without a cap. Keys are capped across all strata. Either
+    way a batch costs O(count + number of strata).
+
+    Args:
+        strata: Item sequences to draw from, or ``PositionGroups`` when
+            ``max_per_group`` is set. An item must not appear twice.
+        count: Number of items wanted.
+        rng: Random stream.
+        max_per_group: Largest number of items sharing a group key, or None.
+
+    Returns:
+        Up to ``count`` distinct items in random order; fewer when the strata
+        run out.
+    """
+    if max_per_group is None:
+        active = [SparseShuffle(items, rng) for items in strata if len(items)]
+    else:
+        taken: Dict[Hashable, int] = {}
+        active = [_CappedDraw(groups, rng, max_per_group, taken) for groups in strata if len(groups)]
+    rng.shuffle(active)
+    result: List[int] = []
+    while active and len(result) < count:
+        still_active = []
+        for source in active:
+            if len(result) == count:
+                still_active.append(source)
+                continue
+            item = source.draw()
+            if item is not None:
+                result.append(item)
+            if len(source):
+                still_active.append(source)
+        active = still_active
+    rng.shuffle(result)
+    return result
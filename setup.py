@@ -23,7 +23,7 @@ setup(
         "Source": "https://github.com/kiaraelix/random-quotes-generator",
         "Documentation": "https://github.com/kiaraelix/random-quotes-generator#readme",
     },
-    packages=find_packages(exclude=["tests", "tests.*", "examples", "examples.*"]),
+    packages=find_packages(exclude=["tests", "tests.*", "examples", "examples.*", "benchmarks", "benchmarks.*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
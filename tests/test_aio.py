@@ -0,0 +1,226 @@
+"""
+Unit tests for the asyncio interface.
+"""
+
+import unittest
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from quotes_generator.aio import AsyncQuoteGenerator
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.response_cache import ResponseCache
+
+
+def run(coro):
+    """Run a coroutine to completion on a fresh event loop."""
+    return asyncio.run(coro)
+
+
+class TestAsyncQuoteGenerator(unittest.TestCase):
+    """Test cases for AsyncQuoteGenerator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_quotes = {
+            "quotes": [
+                {"text": f"Test quote {i}", "author": f"Author {i % 3}", "category": "test"}
+                for i in range(50)
+            ]
+        }
+        self.temp_file = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.json'
+        )
+        json.dump(self.test_quotes, self.temp_file)
+        self.temp_file.close()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        Path(self.temp_file.name).unlink()
+
+    def test_load_and_query(self):
+        """Test loading and delegated queries."""
+        async def scenario():
+            generator = await AsyncQuoteGenerator.create(self.temp_file.name)
+            self.assertTrue(generator.loaded)
+            self.assertEqual(len(generator.quotes), 50)
+            self.assertEqual(generator.get_random_quote(category="test")["category"], "test")
+            self.assertEqual(generator.get_categories(), {"test"})
+        run(scenario())
+
+    def test_not_loaded(self):
+        """Test that queries before load raise a clear error."""
+        generator = AsyncQuoteGenerator(self.temp_file.name)
+        self.assertFalse(generator.loaded)
+        with self.assertRaises(RuntimeError):
+            generator.get_random_quote()
+
+    def test_load_errors(self):
+        """Test that load errors propagate."""
+        with self.assertRaises(FileNotFoundError):
+            run(AsyncQuoteGenerator.create("nonexistent_file.json"))
+
+    def test_blocking_methods_hidden(self):
+        """Test that the synchronous export is not exposed."""
+        async def scenario():
+            generator = await AsyncQuoteGenerator.create(self.temp_file.name)
+            with self.assertRaises(AttributeError):
+                generator.export_quotes
+        run(scenario())
+
+    def test_export(self):
+        """Test the awaitable export."""
+        output_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+        output_file.close()
+
+        async def scenario():
+            generator = await AsyncQuoteGenerator.create(self.temp_file.name)
+            await generator.export(output_file.name)
+
+        try:
+            run(scenario())
+            with open(output_file.name) as f:
+                self.assertEqual(len(json.load(f)["quotes"]), 50)
+        finally:
+            Path(output_file.name).unlink()
+
+    def test_reload(self):
+        """Test that reload swaps in the new collection and clears caches."""
+        cache = ResponseCache()
+
+        async def scenario():
+            generator = await AsyncQuoteGenerator.create(self.temp_file.name, response_cache=cache)
+            old = generator.generator
+            generator.render_quotes(generator.quotes)
+            with open(self.temp_file.name, "w") as f:
+                json.dump({"quotes": self.test_quotes["quotes"][:5]}, f)
+            await generator.reload()
+            self.assertIsNot(generator.generator, old)
+            self.assertEqual(len(generator.quotes), 5)
+            self.assertEqual(len(cache), 0)
+        run(scenario())
+
+    def test_async_iteration(self):
+        """Test chunked async iteration matches the synchronous results."""
+        async def scenario():
+            generator = await AsyncQuoteGenerator.create(self.temp_file.name)
+            found = [q async for q in generator.iter_search("quote 1", chunk_size=7)]
+            self.assertEqual(found, generator.search_quotes("quote 1"))
+            by_author = [q async for q in generator.iter_by_author("author 2", chunk_size=4)]
+            self.assertEqual(by_author, generator.get_quotes_by_author("author 2"))
+        run(scenario())
+
+    def test_lazy_index_queries(self):
+        """Test awaitable fuzzy search and capped sampling match the synchronous results."""
+        async def scenario():
+            generator = await AsyncQuoteGenerator.create(self.temp_file.name)
+            sync = QuoteGenerator(self.temp_file.name)
+            found = await generator.search("qoute 1", fuzzy=True)
+            self.assertEqual(found, sync.search_quotes("qoute 1", fuzzy=True))
+            self.assertEqual(await generator.search("quote 1"), sync.search_quotes("quote 1"))
+            batch = await generator.sample(10, seed=3, max_per_author=2)
+            self.assertEqual(batch, sync.get_multiple_quotes(10, seed=3, max_per_author=2))
+            self.assertEqual(len(batch), 6)
+        run(scenario())
+
+    def test_iteration_yields_to_loop(self):
+        """Test that other tasks run while a large scan is in progress."""
+        async def scenario():
+            generator = await AsyncQuoteGenerator.create(self.temp_file.name)
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            start = ticks
+            async for _ in generator.iter_search("test", chunk_size=5):
+                pass
+            task.cancel()
+            self.assertGreaterEqual(ticks - start, 9)
+        run(scenario())
+
+
+class TestEventLoopLag(unittest.TestCase):
+    """Measure event-loop lag while loading and indexing a large collection."""
+
+    def setUp(self):
+        """Write a collection large enough for loading to take a while."""
+        base = QuoteGenerator().quotes
+        quotes = [
+            dict(base[i % len(base)], text=f"{base[i % len(base)]['text']} {i}")
+            for i in range(50000)
+        ]
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"quotes": quotes}, f)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        os.unlink(self.path)
+
+    @staticmethod
+    def max_lag(make_work):
+        """Largest loop stall while awaiting the coroutine from ``make_work``."""
+        async def measure_lag():
+            max_lag = 0.0
+            done = False
+
+            async def ticker():
+                nonlocal max_lag
+                while not done:
+                    before = time.perf_counter()
+                    await asyncio.sleep(0.001)
+                    max_lag = max(max_lag, time.perf_counter() - before - 0.001)
+
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0.005)
+            await make_work()
+            done = True
+            await task
+            return max_lag
+
+        return run(measure_lag())
+
+    def test_load_lag_below_blocking_time(self):
+        """Test that awaiting load stalls the loop far less than a blocking load."""
+        start = time.perf_counter()
+        QuoteGenerator(self.path)
+        blocking = time.perf_counter() - start
+
+        lag = self.max_lag(lambda: AsyncQuoteGenerator.create(self.path))
+        self.assertLess(lag, blocking / 2)
+
+    def test_first_fuzzy_search_lag(self):
+        """Test that the first fuzzy search builds its index off the loop."""
+        start = time.perf_counter()
+        QuoteGenerator(self.path).search_quotes("lfe", fuzzy=True)
+        blocking = time.perf_counter() - start
+        generator = run(AsyncQuoteGenerator.create(self.path))
+
+        lag = self.max_lag(lambda: generator.search("lfe", fuzzy=True))
+        self.assertLess(lag, blocking / 2)
+        self.assertIsNotNone(generator.generator._state.fuzzy_index)
+
+    def test_first_capped_batch_lag(self):
+        """Test that the first max_per_author batch builds its index off the loop."""
+        sync = QuoteGenerator(self.path)
+        start = time.perf_counter()
+        sync.get_multiple_quotes(10, max_per_author=1)
+        blocking = time.perf_counter() - start
+        generator = run(AsyncQuoteGenerator.create(self.path))
+
+        lag = self.max_lag(lambda: generator.sample(10, max_per_author=1))
+        self.assertLess(lag, blocking / 2)
+        self.assertIsNotNone(generator.generator._state.author_index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Unit tests for compressed text storage.
+"""
+
+import unittest
+import json
+import tempfile
+from pathlib import Path
+from quotes_generator.compressed import (
+    CompressedQuote,
+    CompressedTextStore,
+    pack_quotes,
+    train_dictionary,
+)
+from quotes_generator.generator import QuoteGenerator
+
+
+class TestCompressedTextStore(unittest.TestCase):
+    """Test cases for CompressedTextStore."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.texts = [f"The quote number {i} is about life and café ☕" for i in range(50)]
+
+    def test_round_trip(self):
+        """Test that every text reads back unchanged, including the tail."""
+        for codec in ("zlib", "lzma"):
+            store = CompressedTextStore(self.texts, block_size=8, codec=codec)
+            self.assertEqual(list(store), self.texts)
+            self.assertEqual(store[-1], self.texts[-1])
+            self.assertEqual(len(store), 50)
+
+    def test_append(self):
+        """Test appending across a block boundary."""
+        store = CompressedTextStore(self.texts[:7], block_size=8)
+        store.append("eighth")
+        store.append("ninth")
+        self.assertEqual(store[7], "eighth")
+        self.assertEqual(store[8], "ninth")
+        self.assertEqual(store.stats()["blocks"], 1)
+
+    def test_compresses(self):
+        """Test that repetitive text takes less space than raw."""
+        store = CompressedTextStore(self.texts * 10)
+        stats = store.stats()
+        self.assertGreater(stats["ratio"], 2)
+        self.assertLess(stats["compressed_bytes"], stats["raw_bytes"])
+
+    def test_block_cache_bounded(self):
+        """Test that the decompressed-block LRU stays within its size."""
+        store = CompressedTextStore(self.texts, block_size=4, cache_blocks=2)
+        for text in store:
+            pass
+        self.assertLessEqual(len(store._cache), 2)
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with self.assertRaises(ValueError):
+            CompressedTextStore(codec="bz2")
+        with self.assertRaises(ValueError):
+            CompressedTextStore(block_size=0)
+        with self.assertRaises(IndexError):
+            CompressedTextStore(["a"])[1]
+
+    def test_train_dictionary(self):
+        """Test dictionary size limit and that frequent words are included."""
+        dictionary = train_dictionary(self.texts, size=64)
+        self.assertLessEqual(len(dictionary), 64)
+        self.assertIn(b"quote", dictionary)
+
+
+class TestCompressedQuote(unittest.TestCase):
+    """Test cases for CompressedQuote and pack_quotes."""
+
+    def test_behaves_like_dict(self):
+        """Test mapping access, equality and conversion."""
+        raw = {"text": "Hello", "author": "A", "category": "c", "source": "s"}
+        quote = pack_quotes([raw], CompressedTextStore())[0]
+        self.assertEqual(quote["text"], "Hello")
+        self.assertEqual(quote.get("source"), "s")
+        self.assertIsNone(quote.get("missing"))
+        self.assertEqual(dict(quote), raw)
+        self.assertEqual(quote, raw)
+        self.assertIsInstance(quote, CompressedQuote)
+
+    def test_shared_strings(self):
+        """Test that equal authors share one string object."""
+        quotes = pack_quotes(
+            [{"text": "x", "author": "".join(["Au", "thor"]), "category": "c"},
+             {"text": "y", "author": "".join(["Aut", "hor"]), "category": "c"}],
+            CompressedTextStore(),
+        )
+        self.assertIs(quotes[0]["author"], quotes[1]["author"])
+
+
+class TestGeneratorCompressText(unittest.TestCase):
+    """Test cases for QuoteGenerator(compress_text=True)."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.plain = QuoteGenerator()
+        self.generator = QuoteGenerator(compress_text=True)
+
+    def test_same_content(self):
+        """Test that compressed quotes equal the plain ones."""
+        self.assertIsNotNone(self.generator.text_store)
+        self.assertEqual([dict(q) for q in self.generator.quotes], self.plain.quotes)
+
+    def test_queries(self):
+        """Test that queries work on compressed quotes."""
+        self.assertEqual(
+            len(self.generator.search_quotes("life")), len(self.plain.search_quotes("life"))
+        )
+        self.assertEqual(self.generator.get_statistics(), self.plain.get_statistics())
+        self.assertEqual(
+            json.loads(self.generator.render_quotes(self.generator.quotes[:3])),
+            self.plain.quotes[:3],
+        )
+
+    def test_add_quote_and_export(self):
+        """Test adding a quote and exporting the compressed collection."""
+        self.generator.add_quote({"text": "Brand new", "author": "Me", "category": "new"})
+        self.assertEqual(self.generator.get_random_quote(category="new")["text"], "Brand new")
+
+        output_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+        output_file.close()
+        try:
+            self.generator.export_quotes(output_file.name, category="new")
+            with open(output_file.name, encoding="utf-8") as f:
+                data = json.load(f)
+            self.assertEqual(data["quotes"], [{"text": "Brand new", "author": "Me", "category": "new"}])
+        finally:
+            Path(output_file.name).unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()
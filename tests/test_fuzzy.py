@@ -0,0 +1,105 @@
+"""
+Unit tests for the fuzzy search index.
+"""
+
+import unittest
+from quotes_generator.fuzzy import FuzzyIndex, edit_distance, tokenize
+
+
+class TestEditDistance(unittest.TestCase):
+    """Test cases for edit_distance."""
+
+    def test_edits(self):
+        """Test each kind of edit counts once."""
+        self.assertEqual(edit_distance("success", "success", 2), 0)
+        self.assertEqual(edit_distance("success", "sucess", 2), 1)
+        self.assertEqual(edit_distance("success", "succcess", 2), 1)
+        self.assertEqual(edit_distance("success", "suckess", 2), 1)
+        self.assertEqual(edit_distance("success", "sucsess", 2), 1)
+        self.assertEqual(edit_distance("kitten", "sitting", 3), 3)
+
+    def test_cutoff(self):
+        """Test distances above the cutoff are reported as cutoff + 1."""
+        self.assertEqual(edit_distance("kitten", "sitting", 1), 2)
+        self.assertEqual(edit_distance("a", "abcdef", 2), 3)
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    """Test cases for FuzzyIndex."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.texts = [
+            "Stay hungry, stay foolish.",
+            "The only way to do great work is to love what you do.",
+            "Success is not final, failure is not fatal.",
+            "Don't watch the clock; do what it does.",
+            "Great things never come from comfort zones.",
+        ]
+        self.index = FuzzyIndex.build(self.texts)
+
+    def test_tokenize(self):
+        """Test words are lowercased and contractions kept together."""
+        self.assertEqual(tokenize("Don't watch the Clock;"), ["don't", "watch", "the", "clock"])
+
+    def test_exact(self):
+        """Test exact word lookups."""
+        self.assertEqual(self.index.search("foolish"), [0])
+        self.assertEqual(self.index.search("great"), [1, 4])
+
+    def test_typos(self):
+        """Test misspelled words within the distance match."""
+        self.assertEqual(self.index.search("sucess"), [2])
+        self.assertEqual(self.index.search("fooilsh"), [0])
+        self.assertEqual(self.index.search("failyre fatl"), [2])
+        self.assertEqual(self.index.search("sucesss"), [])
+        self.assertEqual(self.index.search("sucesss", max_distance=2), [2])
+
+    def test_long_words(self):
+        """Test typos after the indexed prefix are still found."""
+        index = FuzzyIndex.build(["Perseverance conquers", "Perseverence"], prefix_length=5)
+        self.assertEqual(index.search("perseverance"), [0, 1])
+        self.assertEqual(index.search("persevarence", max_distance=2), [1, 0])
+
+    def test_ranking(self):
+        """Test closer matches rank first, ties in collection order."""
+        index = FuzzyIndex.build(["work hard", "wark hard", "work hard again"])
+        self.assertEqual(index.search("work"), [0, 2, 1])
+        self.assertEqual(index.search("wark hard"), [1, 0, 2])
+
+    def test_all_words_required(self):
+        """Test every query word must match."""
+        self.assertEqual(self.index.search("great comfort"), [4])
+        self.assertEqual(self.index.search("great hungry"), [])
+
+    def test_short_words(self):
+        """Test a word never matches at a distance of its own length."""
+        self.assertEqual(self.index.lookup("is"), {"is": 0, "it": 1})
+        self.assertEqual(self.index.search("is"), [1, 2, 3])
+        self.assertEqual(self.index.lookup("a"), {})
+
+    def test_empty_query(self):
+        """Test a query without words matches nothing."""
+        self.assertEqual(self.index.search(" ;,"), [])
+
+    def test_add(self):
+        """Test quotes added later are searchable."""
+        self.index.add(5, "Success usually comes to those who are too busy")
+        self.assertEqual(self.index.search("sucess"), [2, 5])
+
+    def test_invalid_distance(self):
+        """Test out-of-range distances raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.index.search("great", max_distance=3)
+        with self.assertRaises(ValueError):
+            FuzzyIndex(max_distance=2, prefix_length=2)
+
+    def test_stats(self):
+        """Test statistics."""
+        stats = FuzzyIndex.build(["a b", "b"]).stats()
+        self.assertEqual(stats["terms"], 2)
+        self.assertEqual(stats["postings"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
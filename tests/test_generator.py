@@ -5,6 +5,7 @@ Unit tests for the QuoteGenerator class.
 import unittest
 import json
 import tempfile
+import threading
 from pathlib import Path
 from quotes_generator.generator import QuoteGenerator
 
@@ -172,6 +173,93 @@ class TestQuoteGenerator(unittest.TestCase):
         finally:
             Path(temp_file.name).unlink()
 
+    def test_search_quotes_fuzzy(self):
+        """Test typo-tolerant search ranks exact word matches first."""
+        self.generator.add_quote({"text": "Test qoute 5", "author": "Author 4", "category": "test"})
+        self.assertEqual(self.generator.search_quotes("qoute"), self.generator.quotes[4:])
+        results = self.generator.search_quotes("qoute", fuzzy=True)
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[0]["text"], "Test qoute 5")
+        self.assertEqual(self.generator.search_quotes("qoute", fuzzy=True, max_distance=0), results[:1])
+
+    def test_search_quotes_fuzzy_invalid_distance(self):
+        """Test that an unsupported edit distance raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.generator.search_quotes("test", fuzzy=True, max_distance=3)
+
+    def test_add_quote(self):
+        """Test adding a quote updates the collection and category index."""
+        self.generator.add_quote({"text": "New", "author": "Author 4", "category": "wisdom"})
+        self.assertEqual(len(self.generator.quotes), 5)
+        self.assertEqual(len(self.generator.get_multiple_quotes(2, category="wisdom")), 2)
+
+    def test_add_quote_copies(self):
+        """Test that changing an added quote afterwards has no effect."""
+        quote = {"text": " New ", "author": "Author 4", "category": "wisdom"}
+        self.generator.add_quote(quote)
+        quote["text"] = "Changed"
+        quote["author"] = "Someone else"
+        self.assertEqual(self.generator.quotes[-1]["text"], "New")
+        self.assertEqual(len(self.generator.get_quotes_by_author("Author 4")), 1)
+        self.assertEqual(len(self.generator.search_quotes("new")), 1)
+        self.assertEqual(self.generator.get_quotes_by_length(3, 3)[0]["author"], "Author 4")
+
+    def test_add_quote_missing_fields(self):
+        """Test that add_quote validates required fields."""
+        with self.assertRaises(ValueError):
+            self.generator.add_quote({"text": "New", "author": "Author 4"})
+        self.assertEqual(len(self.generator.quotes), 4)
+
+    def test_reload(self):
+        """Test reloading the quotes file."""
+        with open(self.temp_file.name, "w") as f:
+            json.dump({"quotes": self.test_quotes["quotes"][:2]}, f)
+        self.generator.reload()
+        self.assertEqual(len(self.generator.quotes), 2)
+        self.assertIsNone(self.generator.get_random_quote(category="wisdom"))
+        self.assertEqual(len(self.generator.search_quotes("quote", fuzzy=True)), 2)
+
+    def test_reload_invalid_keeps_quotes(self):
+        """Test that a failed reload keeps the current collection."""
+        with open(self.temp_file.name, "w") as f:
+            json.dump({"quotes": [{"text": "Invalid"}]}, f)
+        with self.assertRaises(ValueError):
+            self.generator.reload()
+        self.assertEqual(len(self.generator.quotes), 4)
+        self.assertEqual(len(self.generator._state.author_keys), 4)
+        self.assertEqual(len(self.generator.search_quotes("quote")), 4)
+
+    def test_reload_resets_folded_keys(self):
+        """Test that keys of authors no longer present are dropped on reload."""
+        with open(self.temp_file.name, "w") as f:
+            json.dump({"quotes": [{"text": "New", "author": "Newcomer", "category": "fresh"}]}, f)
+        self.generator.reload()
+        self.assertEqual(set(self.generator._state.folded), {"Newcomer", "fresh"})
+        self.assertEqual(self.generator.get_quotes_by_author("NEWCOMER")[0]["text"], "New")
+
+    def test_reload_during_queries(self):
+        """Test that queries running alongside reloads see one whole collection."""
+        large = [{"text": f"Quote {i}", "author": f"Author {i}", "category": "test"}
+                 for i in range(200)]
+        small = self.test_quotes["quotes"][:1]
+        stop = threading.Event()
+
+        def reload_loop():
+            for i in range(50):
+                with open(self.temp_file.name, "w") as f:
+                    json.dump({"quotes": large if i % 2 else small}, f)
+                self.generator.reload()
+            stop.set()
+
+        thread = threading.Thread(target=reload_loop)
+        thread.start()
+        try:
+            while not stop.is_set():
+                self.assertIsNotNone(self.generator.get_random_quote(category="test"))
+                self.assertIn(len(self.generator.get_quotes_by_length(category="test")), (1, 2, 200))
+        finally:
+            thread.join()
+
     def test_file_not_found(self):
         """Test that FileNotFoundError is raised for missing file."""
         with self.assertRaises(FileNotFoundError):
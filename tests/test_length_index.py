@@ -0,0 +1,117 @@
+"""
+Unit tests for the length index.
+"""
+
+import unittest
+import json
+import random
+import tempfile
+from pathlib import Path
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.length_index import LengthIndex
+
+
+class TestLengthIndex(unittest.TestCase):
+    """Test cases for LengthIndex."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = LengthIndex.build([(10, 0), (5, 1), (20, 2), (10, 3), (15, 4)])
+
+    def test_positions_sorted_by_length(self):
+        """Test that positions come back shortest first, ties in order."""
+        self.assertEqual(self.index.positions(), [1, 0, 3, 4, 2])
+
+    def test_range_bounds_inclusive(self):
+        """Test inclusive range filtering."""
+        self.assertEqual(self.index.positions(10, 15), [0, 3, 4])
+        self.assertEqual(self.index.positions(min_length=16), [2])
+        self.assertEqual(self.index.positions(max_length=4), [])
+        self.assertEqual(self.index.count(10, 10), 2)
+        self.assertEqual(self.index.count(30, 10), 0)
+
+    def test_shortest_and_longest(self):
+        """Test top/bottom-N queries."""
+        self.assertEqual(self.index.shortest(2), [1, 0])
+        self.assertEqual(self.index.longest(2), [2, 4])
+        self.assertEqual(self.index.longest(10), [2, 4, 3, 0, 1])
+        self.assertEqual(self.index.longest(0), [])
+
+    def test_pick_within_range(self):
+        """Test random picks stay inside the window."""
+        rng = random.Random(0)
+        for _ in range(50):
+            self.assertIn(self.index.pick(rng, 10, 15), (0, 3, 4))
+        self.assertIsNone(self.index.pick(rng, 100))
+
+    def test_add_keeps_order(self):
+        """Test incremental inserts."""
+        self.index.add(10, 5)
+        self.index.add(1, 6)
+        self.assertEqual(self.index.positions(), [6, 1, 0, 3, 5, 4, 2])
+        self.assertEqual(len(self.index), 7)
+
+
+class TestGeneratorLengthQueries(unittest.TestCase):
+    """Test cases for the length query methods of QuoteGenerator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_quotes = {
+            "quotes": [
+                {"text": "a" * 10, "author": "Author 1", "category": "short"},
+                {"text": "b" * 50, "author": "Author 2", "category": "long"},
+                {"text": "c" * 20, "author": "Author 1", "category": "short"},
+                {"text": "d" * 80, "author": "Author 3", "category": "long"},
+            ]
+        }
+        self.temp_file = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.json'
+        )
+        json.dump(self.test_quotes, self.temp_file)
+        self.temp_file.close()
+
+        self.generator = QuoteGenerator(self.temp_file.name)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        Path(self.temp_file.name).unlink()
+
+    def _lengths(self, quotes):
+        return [len(q["text"]) for q in quotes]
+
+    def test_get_quotes_by_length(self):
+        """Test range queries across and within categories."""
+        self.assertEqual(self._lengths(self.generator.get_quotes_by_length(max_length=50)), [10, 20, 50])
+        self.assertEqual(self._lengths(self.generator.get_quotes_by_length(15, category="SHORT")), [20])
+        self.assertEqual(self.generator.get_quotes_by_length(category="missing"), [])
+
+    def test_get_random_quote_by_length(self):
+        """Test random picks inside a length window."""
+        for _ in range(20):
+            quote = self.generator.get_random_quote_by_length(30, 100)
+            self.assertGreaterEqual(len(quote["text"]), 30)
+        self.assertIsNone(self.generator.get_random_quote_by_length(min_length=1000))
+
+    def test_longest_and_shortest(self):
+        """Test top/bottom-N queries."""
+        self.assertEqual(self._lengths(self.generator.get_longest_quotes(2)), [80, 50])
+        self.assertEqual(self._lengths(self.generator.get_shortest_quotes(1, category="long")), [50])
+
+    def test_consistent_after_add_quote(self):
+        """Test that the index reflects added quotes."""
+        self.generator.add_quote({"text": "e" * 100, "author": "Author 4", "category": "short"})
+        self.assertEqual(self._lengths(self.generator.get_longest_quotes(1)), [100])
+        self.assertEqual(self._lengths(self.generator.get_longest_quotes(1, category="short")), [100])
+
+    def test_consistent_after_reload(self):
+        """Test that the index is rebuilt on reload."""
+        with open(self.temp_file.name, "w") as f:
+            json.dump({"quotes": [{"text": "x" * 5, "author": "A", "category": "c"}]}, f)
+        self.generator.reload()
+        self.assertEqual(self._lengths(self.generator.get_quotes_by_length()), [5])
+        self.assertEqual(self.generator.get_quotes_by_length(category="short"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
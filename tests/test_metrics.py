@@ -0,0 +1,150 @@
+"""
+Unit tests for the metrics module.
+"""
+
+import unittest
+import json
+import tempfile
+import timeit
+from pathlib import Path
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.metrics import Metrics, Histogram, LATENCY_BUCKETS, instrumented
+
+# Maximum slowdown tolerated for an instrumented call with metrics disabled.
+OVERHEAD_BUDGET = 1.5
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for Metrics and generator instrumentation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_quotes = {
+            "quotes": [
+                {"text": "Test quote 1", "author": "Author 1", "category": "test"},
+                {"text": "Test quote 2", "author": "Author 2", "category": "motivation"},
+                {"text": "Test quote 3", "author": "Author 1", "category": "test"},
+            ]
+        }
+
+        self.temp_file = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.json'
+        )
+        json.dump(self.test_quotes, self.temp_file)
+        self.temp_file.close()
+
+        self.metrics = Metrics()
+        self.generator = QuoteGenerator(self.temp_file.name, metrics=self.metrics)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        Path(self.temp_file.name).unlink()
+
+    def test_load_phases_recorded(self):
+        """Test that load and validate are recorded at construction."""
+        operations = self.metrics.snapshot()["operations"]
+        self.assertEqual(operations["_load_quotes"]["calls"], 1)
+        self.assertEqual(operations["_validate_quotes"]["calls"], 1)
+        self.assertEqual(
+            operations["_validate_quotes"]["result_size"]["sum"], len(self.generator.quotes)
+        )
+
+    def test_query_calls_and_sizes(self):
+        """Test call counts and result sizes of query methods."""
+        self.generator.search_quotes("quote")
+        self.generator.search_quotes("quote 1")
+        self.generator.get_quotes_by_author("Author 1")
+
+        operations = self.metrics.snapshot()["operations"]
+        self.assertEqual(operations["search_quotes"]["calls"], 2)
+        self.assertEqual(operations["search_quotes"]["result_size"]["sum"], 4)
+        self.assertEqual(operations["get_quotes_by_author"]["result_size"]["sum"], 2)
+        self.assertEqual(operations["search_quotes"]["latency"]["count"], 2)
+
+    def test_errors_recorded(self):
+        """Test that exceptions are counted and re-raised."""
+        with self.assertRaises(OSError):
+            self.generator.export_quotes("/nonexistent-dir/out.json")
+        operations = self.metrics.snapshot()["operations"]
+        self.assertEqual(operations["export_quotes"]["errors"], 1)
+
+    def test_cache_hit_rate(self):
+        """Test cache hit rate calculation."""
+        self.metrics.record_cache("test", True)
+        self.metrics.record_cache("test", True)
+        self.metrics.record_cache("test", False)
+        cache = self.metrics.snapshot()["caches"]["test"]
+        self.assertEqual(cache["hits"], 2)
+        self.assertEqual(cache["misses"], 1)
+        self.assertAlmostEqual(cache["hit_rate"], 2 / 3)
+
+    def test_histogram_buckets(self):
+        """Test that observations land in the first bucket that covers them."""
+        hist = Histogram((1, 10, 100))
+        for value in (0.5, 1, 5, 1000):
+            hist.observe(value)
+        self.assertEqual(hist.counts, [2, 1, 0, 1])
+        self.assertEqual(len(hist.snapshot()["buckets"]), 4)
+
+    def test_wrap_function(self):
+        """Test wrapping a plain function such as the formatter."""
+        wrapped = self.metrics.wrap("double", lambda x: [x, x])
+        self.assertEqual(wrapped(1), [1, 1])
+        operations = self.metrics.snapshot()["operations"]
+        self.assertEqual(operations["double"]["result_size"]["sum"], 2)
+
+    def test_custom_result_size(self):
+        """Test that instrumented accepts a size function for other results."""
+
+        class Loader:
+            def __init__(self, metrics):
+                self.metrics = metrics
+
+            @instrumented(size=lambda result: len(result[0]))
+            def load(self):
+                return [1, 2, 3], ["a", "b", "c"]
+
+        self.assertEqual(Loader(self.metrics).load(), ([1, 2, 3], ["a", "b", "c"]))
+        self.assertEqual(Loader(None).load.__name__, "load")
+        operations = self.metrics.snapshot()["operations"]
+        self.assertEqual(operations["load"]["result_size"]["sum"], 3)
+
+    def test_prometheus_format(self):
+        """Test the Prometheus text exposition output."""
+        self.generator.get_random_quote()
+        self.metrics.record_cache("test", True)
+        text = self.metrics.to_prometheus()
+        self.assertTrue(text.endswith("\n"))
+        self.assertIn('quotes_generator_calls_total{operation="get_random_quote"} 1', text)
+        self.assertIn(
+            'quotes_generator_latency_seconds_bucket{operation="get_random_quote",le="+Inf"} 1',
+            text,
+        )
+        self.assertIn('quotes_generator_cache_hits_total{cache="test"} 1', text)
+        self.assertEqual(
+            text.count('latency_seconds_bucket{operation="get_random_quote"'),
+            len(LATENCY_BUCKETS) + 1,
+        )
+
+    def test_reset(self):
+        """Test that reset discards all data."""
+        self.generator.get_categories()
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot(), {"operations": {}, "caches": {}})
+
+    def test_disabled_overhead_within_budget(self):
+        """Test that disabled instrumentation stays within the overhead budget."""
+        generator = QuoteGenerator()
+        raw = QuoteGenerator.search_quotes.__wrapped__
+
+        instrumented_time = min(timeit.repeat(
+            lambda: generator.search_quotes("life"), number=200, repeat=7
+        ))
+        raw_time = min(timeit.repeat(
+            lambda: raw(generator, "life"), number=200, repeat=7
+        ))
+        self.assertLess(instrumented_time / raw_time, OVERHEAD_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Unit tests for load-time validation and normalization.
+"""
+
+import unittest
+import json
+import tempfile
+from pathlib import Path
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.normalize import FoldedField, check_quote, fold, normalize_quotes
+
+
+def make_quotes(count):
+    """Valid quotes with surrounding whitespace to strip."""
+    return [
+        {"text": f"  Quote {i} ", "author": f"Author {i % 3}\n", "category": "Test"}
+        for i in range(count)
+    ]
+
+
+class TestFold(unittest.TestCase):
+    """Test cases for fold."""
+
+    def test_case_and_compatibility_forms(self):
+        """Test case folding and NFKC normalization."""
+        self.assertEqual(fold("Straße"), "strasse")
+        self.assertEqual(fold("ＷＩＳＤＯＭ"), "wisdom")
+        self.assertEqual(fold("ﬁnal"), "final")
+        self.assertEqual(fold("Café"), fold("Café"))
+
+
+class TestCheckQuote(unittest.TestCase):
+    """Test cases for check_quote."""
+
+    def test_strips_valid_quote(self):
+        """Test that required fields are stripped in place."""
+        quote = {"text": " Text ", "author": "\tAuthor", "category": "test ", "year": " 1900 "}
+        self.assertIsNone(check_quote(quote))
+        self.assertEqual(quote, {"text": "Text", "author": "Author", "category": "test", "year": " 1900 "})
+
+    def test_problems(self):
+        """Test each kind of invalid record."""
+        self.assertEqual(check_quote({"text": "Text"}), "is missing required fields: author, category")
+        self.assertEqual(check_quote({"text": "Text", "author": 5, "category": "c"}), "has a non-string 'author'")
+        self.assertEqual(check_quote({"text": "  ", "author": "a", "category": "c"}), "has an empty 'text'")
+        self.assertEqual(check_quote(["text"]), "is not an object but list")
+
+
+class TestNormalizeQuotes(unittest.TestCase):
+    """Test cases for normalize_quotes."""
+
+    def test_text_keys(self):
+        """Test that folded text keys line up with the quotes."""
+        quotes, keys = normalize_quotes(make_quotes(3))
+        self.assertEqual(quotes[2]["text"], "Quote 2")
+        self.assertEqual(keys, ["quote 0", "quote 1", "quote 2"])
+        self.assertEqual(normalize_quotes(make_quotes(3), text_keys=False)[1], [])
+
+    def test_all_errors_reported(self):
+        """Test that every invalid record is listed, not just the first."""
+        quotes = make_quotes(6)
+        del quotes[1]["author"]
+        quotes[4]["category"] = ""
+        with self.assertRaises(ValueError) as context:
+            normalize_quotes(quotes)
+        message = str(context.exception)
+        self.assertIn("2 invalid quote(s)", message)
+        self.assertIn("Quote at index 1 is missing required fields: author", message)
+        self.assertIn("Quote at index 4 has an empty 'category'", message)
+
+    def test_error_list_truncated(self):
+        """Test that long error lists are cut short."""
+        with self.assertRaises(ValueError) as context:
+            normalize_quotes([{}] * 25)
+        self.assertIn("25 invalid quote(s)", str(context.exception))
+        self.assertIn("... and 5 more", str(context.exception))
+
+    def test_folded_field(self):
+        """Test the lazily folded key view."""
+        keys = FoldedField([{"text": "ÉTÉ"}, {"text": "Straße"}], "text")
+        self.assertEqual(len(keys), 2)
+        self.assertEqual(keys[1], "strasse")
+        self.assertEqual(keys[0:2], ["été", "strasse"])
+
+
+class TestGeneratorNormalization(unittest.TestCase):
+    """Test that the generator stores normalized quotes and queries folded keys."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        quotes = make_quotes(4) + [
+            {"text": "Die Straße ist lang.", "author": "Ｇoethe", "category": "ＷＩＳＤＯＭ"},
+        ]
+        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json', encoding='utf-8')
+        json.dump({"quotes": quotes}, self.temp_file)
+        self.temp_file.close()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        Path(self.temp_file.name).unlink()
+
+    def test_queries_use_folded_keys(self):
+        """Test lookups are case- and width-insensitive in both storage modes."""
+        for compress_text in (False, True):
+            generator = QuoteGenerator(self.temp_file.name, compress_text=compress_text)
+            self.assertEqual(generator.quotes[0]["text"], "Quote 0")
+            self.assertEqual(generator.quotes[1]["author"], "Author 1")
+            self.assertEqual(len(generator.search_quotes("STRASSE")), 1)
+            self.assertEqual(len(generator.get_quotes_by_author("goethe")), 1)
+            self.assertEqual(generator.get_random_quote(category="wisdom")["author"], "Ｇoethe")
+            self.assertEqual(len(generator.get_multiple_quotes(5, category="TEST", strategy="stratified")), 4)
+
+    def test_add_quote_normalized(self):
+        """Test that added quotes are stripped and searchable."""
+        generator = QuoteGenerator(self.temp_file.name)
+        generator.add_quote({"text": " Ｆull width ", "author": "New", "category": "test"})
+        self.assertEqual(generator.quotes[-1]["text"], "Ｆull width")
+        self.assertEqual(generator.search_quotes("full"), [generator.quotes[-1]])
+        with self.assertRaises(ValueError):
+            generator.add_quote({"text": "", "author": "New", "category": "test"})
+        self.assertEqual(len(generator.quotes), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
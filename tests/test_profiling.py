@@ -0,0 +1,110 @@
+"""
+Unit tests for the profiling module.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import pstats
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.profiling import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    """Test cases for Profiler and ProfileReport."""
+
+    def setUp(self):
+        """Profile loading the default collection and a search."""
+        with Profiler() as profiler:
+            generator = QuoteGenerator()
+            generator.search_quotes("life")
+        self.report = profiler.report
+
+    def test_report_created(self):
+        """Test that a report is available after the block exits."""
+        self.assertIsNotNone(self.report)
+        self.assertGreater(self.report.seconds, 0)
+        self.assertGreater(self.report.peak_memory, 0)
+
+    def test_load_phases(self):
+        """Test that load phases are recorded in order."""
+        names = [phase.name for phase in self.report.phases]
+        self.assertEqual(names[:2], ["_load_quotes", "_validate_quotes"])
+        load = self.report.phases[0]
+        self.assertGreater(load.allocated, 0)
+        self.assertTrue(load.top_sites)
+
+    def test_top_functions(self):
+        """Test that top functions are sorted by cumulative time."""
+        rows = self.report.top_functions(5)
+        self.assertLessEqual(len(rows), 5)
+        cumulative = [row[3] for row in rows]
+        self.assertEqual(cumulative, sorted(cumulative, reverse=True))
+        names = " ".join(row[0] for row in self.report.top_functions(50))
+        self.assertIn("search_quotes", names)
+
+    def test_format(self):
+        """Test the human-readable report."""
+        text = self.report.format()
+        self.assertIn("Load phases:", text)
+        self.assertIn("_load_quotes", text)
+        self.assertIn("Top functions by cumulative time:", text)
+
+    def test_output_files(self):
+        """Test writing pstats and collapsed-stack files."""
+        with tempfile.TemporaryDirectory() as tmp:
+            stats_file = os.path.join(tmp, "out.pstats")
+            collapsed_file = os.path.join(tmp, "out.collapsed")
+            self.report.dump_stats(stats_file)
+            self.report.write_collapsed(collapsed_file)
+
+            self.assertTrue(pstats.Stats(stats_file).stats)
+            with open(collapsed_file, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            self.assertTrue(lines)
+            for line in lines:
+                stack, micros = line.rsplit(" ", 1)
+                self.assertTrue(stack)
+                self.assertGreater(int(micros), 0)
+
+    def test_peak_outside_phases(self):
+        """Test that a later phase does not hide an earlier peak."""
+        with Profiler() as profiler:
+            buffer = bytearray(20 * 2**20)
+            del buffer
+            QuoteGenerator()
+        self.assertTrue(profiler.report.phases)
+        self.assertGreaterEqual(profiler.report.peak_memory, 20 * 2**20)
+
+    def test_no_phases_without_profiler(self):
+        """Test that phases are only recorded inside a profiling block."""
+        with Profiler(memory=False) as profiler:
+            pass
+        QuoteGenerator()
+        self.assertEqual(profiler.report.phases, [])
+
+    def test_other_threads_not_profiled(self):
+        """Test that work on another thread neither records phases nor installs cProfile."""
+        hooks = []
+
+        def worker():
+            QuoteGenerator()
+            with profiler.phase("other"):
+                pass
+            hooks.append(sys.getprofile())
+
+        with Profiler(memory=False) as profiler:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            QuoteGenerator()
+        self.assertEqual(hooks, [None])
+        names = [phase.name for phase in profiler.report.phases]
+        self.assertEqual(names.count("_load_quotes"), 1)
+        self.assertIn("other", names)
+
+
+if __name__ == "__main__":
+    unittest.main()
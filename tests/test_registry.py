@@ -0,0 +1,181 @@
+"""
+Unit tests for the corpus registry.
+"""
+
+import unittest
+import json
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.metrics import Metrics
+from quotes_generator.registry import CorpusRegistry, estimate_size
+
+
+class TestCorpusRegistry(unittest.TestCase):
+    """Test cases for CorpusRegistry."""
+
+    def setUp(self):
+        """Create three tenant corpora sharing authors and categories."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.files = []
+        for tenant in range(3):
+            path = Path(self.temp_dir.name) / f"tenant{tenant}.json"
+            quotes = [
+                {"text": f"Tenant {tenant} quote {i}", "author": f"Author {i % 2}",
+                 "category": "shared"}
+                for i in range(20)
+            ]
+            path.write_text(json.dumps({"quotes": quotes}), encoding="utf-8")
+            self.files.append(str(path))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_loads_on_demand_and_caches(self):
+        """Test that a corpus is parsed once and then served from memory."""
+        registry = CorpusRegistry()
+        self.assertNotIn(self.files[0], registry)
+        first = registry.get(self.files[0])
+        self.assertIs(registry.get(self.files[0]), first)
+        self.assertIn(self.files[0], registry)
+
+        stats = registry.stats()["corpora"][str(Path(self.files[0]).resolve())]
+        self.assertEqual(stats["loads"], 1)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["quotes"], 20)
+        self.assertGreater(stats["bytes"], 0)
+
+    def test_strings_shared_across_corpora(self):
+        """Test that equal authors in different files are one object."""
+        registry = CorpusRegistry()
+        first = registry.get(self.files[0])
+        second = registry.get(self.files[1])
+        self.assertIs(first.quotes[0]["author"], second.quotes[0]["author"])
+        self.assertIs(first.quotes[0]["category"], second.quotes[5]["category"])
+        self.assertIs(first._state.author_keys[0], second._state.author_keys[0])
+        # "Author 0", "Author 1", "shared" and the folded "author 0", "author 1"
+        self.assertEqual(registry.stats()["shared_strings"], 5)
+
+    def test_lru_eviction(self):
+        """Test that least recently used corpora are evicted over budget."""
+        size = estimate_size(QuoteGenerator(self.files[0]))
+        registry = CorpusRegistry(max_bytes=int(size * 2.5))
+        registry.get(self.files[0])
+        registry.get(self.files[1])
+        registry.get(self.files[0])
+        registry.get(self.files[2])
+
+        self.assertEqual(len(registry), 2)
+        self.assertIn(self.files[0], registry)
+        self.assertNotIn(self.files[1], registry)
+        self.assertLessEqual(registry.total_bytes, registry.max_bytes)
+        evicted = registry.stats()["corpora"][str(Path(self.files[1]).resolve())]
+        self.assertEqual(evicted["evictions"], 1)
+        self.assertFalse(evicted["loaded"])
+
+    def test_single_corpus_over_budget_kept(self):
+        """Test that the corpus just loaded is never evicted."""
+        registry = CorpusRegistry(max_bytes=1)
+        generator = registry.get(self.files[0])
+        self.assertIs(registry.get(self.files[0]), generator)
+
+    def test_concurrent_loads_coalesced(self):
+        """Test that concurrent requests for one file share a single parse."""
+        release = threading.Event()
+        calls = []
+
+        def slow_generator(*args, **kwargs):
+            calls.append(args)
+            release.wait(5)
+            return QuoteGenerator(*args, **kwargs)
+
+        registry = CorpusRegistry()
+        results = []
+        with mock.patch("quotes_generator.registry.QuoteGenerator", side_effect=slow_generator):
+            threads = [
+                threading.Thread(target=lambda: results.append(registry.get(self.files[0])))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            while registry.stats()["corpora"][str(Path(self.files[0]).resolve())]["coalesced"] < 3:
+                threading.Event().wait(0.01)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_load_error_propagates(self):
+        """Test that a failed load raises and can be retried."""
+        registry = CorpusRegistry()
+        missing = str(Path(self.temp_dir.name) / "missing.json")
+        with self.assertRaises(FileNotFoundError):
+            registry.get(missing)
+        with self.assertRaises(FileNotFoundError):
+            registry.get(missing)
+
+    def test_evict_and_clear(self):
+        """Test explicit eviction."""
+        registry = CorpusRegistry()
+        registry.get(self.files[0])
+        registry.get(self.files[1])
+        self.assertTrue(registry.evict(self.files[0]))
+        self.assertFalse(registry.evict(self.files[0]))
+        registry.clear()
+        self.assertEqual(len(registry), 0)
+        stats = registry.stats()
+        self.assertEqual(stats["shared_strings"], 0)
+        # Only the empty string table is left.
+        self.assertEqual(registry.total_bytes, stats["string_bytes"])
+
+    def test_string_table_pruned_on_eviction(self):
+        """Test that strings only used by evicted corpora leave the table."""
+        files = []
+        for tenant in range(50):
+            path = Path(self.temp_dir.name) / f"own{tenant}.json"
+            quotes = [
+                {"text": f"Quote {i}", "author": f"Tenant {tenant} author {i}",
+                 "category": f"Tenant {tenant} category"}
+                for i in range(10)
+            ]
+            path.write_text(json.dumps({"quotes": quotes}), encoding="utf-8")
+            files.append(str(path))
+        single = CorpusRegistry()
+        single.get(files[0])
+        budget = int(single.total_bytes * 2.5)
+
+        registry = CorpusRegistry(max_bytes=budget)
+        for path in files:
+            registry.get(path)
+            self.assertLessEqual(registry.total_bytes, budget)
+        # 10 authors and one category per corpus, each with a folded key.
+        self.assertEqual(registry.stats()["shared_strings"], 22 * len(registry))
+        self.assertIn("Tenant 49 category", registry._strings)
+        self.assertNotIn("Tenant 0 category", registry._strings)
+
+    def test_generator_options_and_metrics(self):
+        """Test that options reach generators and hits are recorded."""
+        metrics = Metrics()
+        registry = CorpusRegistry(compress_text=True, metrics=metrics)
+        generator = registry.get(self.files[0])
+        registry.get(self.files[0])
+        self.assertIsNotNone(generator.text_store)
+        cache = metrics.snapshot()["caches"]["corpus_registry"]
+        self.assertEqual((cache["hits"], cache["misses"]), (1, 1))
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with self.assertRaises(ValueError):
+            CorpusRegistry(max_bytes=0)
+        with self.assertRaises(ValueError):
+            CorpusRegistry(strings={})
+
+
+if __name__ == "__main__":
+    unittest.main()
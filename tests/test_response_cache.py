@@ -0,0 +1,138 @@
+"""
+Unit tests for the response cache.
+"""
+
+import unittest
+import json
+import tempfile
+from pathlib import Path
+from quotes_generator.formatter import format_quote
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.metrics import Metrics
+from quotes_generator.response_cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for ResponseCache."""
+
+    def test_get_and_put(self):
+        """Test basic hits and misses."""
+        cache = ResponseCache()
+        obj = {"a": 1}
+        self.assertIsNone(cache.get(obj, "json"))
+        cache.put(obj, "json", b"data")
+        self.assertEqual(cache.get(obj, "json"), b"data")
+        self.assertIsNone(cache.get(obj, "text"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_identity_checked(self):
+        """Test that an equal but distinct object is a miss."""
+        cache = ResponseCache()
+        cache.put({"a": 1}, "json", b"data")
+        self.assertIsNone(cache.get({"a": 1}, "json"))
+
+    def test_lru_eviction_respects_bound(self):
+        """Test that least-recently-used entries are evicted to stay in bounds."""
+        cache = ResponseCache(max_bytes=1400)
+        objs = [object() for _ in range(3)]
+        for obj in objs:
+            cache.put(obj, "v", b"x" * 300)
+        cache.get(objs[0], "v")
+        cache.put(object(), "v", b"x" * 300)
+
+        self.assertLessEqual(cache.size_bytes, 1400)
+        self.assertEqual(len(cache), 3)
+        self.assertIsNotNone(cache.get(objs[0], "v"))
+        self.assertIsNone(cache.get(objs[1], "v"))
+
+    def test_oversized_not_cached(self):
+        """Test that buffers larger than the bound are skipped."""
+        cache = ResponseCache(max_bytes=100)
+        cache.put(object(), "v", b"x" * 200)
+        self.assertEqual(len(cache), 0)
+
+    def test_get_many(self):
+        """Test batched lookups."""
+        cache = ResponseCache()
+        objs = [object(), object()]
+        cache.put(objs[1], "v", b"b")
+        self.assertEqual(cache.get_many(objs, "v"), [None, b"b"])
+
+    def test_invalid_bound(self):
+        """Test that a non-positive bound is rejected."""
+        with self.assertRaises(ValueError):
+            ResponseCache(max_bytes=0)
+
+
+class TestRenderQuotes(unittest.TestCase):
+    """Test cases for QuoteGenerator.render_quotes."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_quotes = {
+            "quotes": [
+                {"text": "Test quote 1", "author": "Autor Ü", "category": "test"},
+                {"text": "Test quote 2", "author": "Author 2", "category": "motivation"},
+            ]
+        }
+        self.temp_file = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.json'
+        )
+        json.dump(self.test_quotes, self.temp_file)
+        self.temp_file.close()
+
+        self.metrics = Metrics()
+        self.cache = ResponseCache()
+        self.generator = QuoteGenerator(
+            self.temp_file.name, metrics=self.metrics, response_cache=self.cache
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        Path(self.temp_file.name).unlink()
+
+    def test_render_json(self):
+        """Test that JSON output round-trips."""
+        body = self.generator.render_quotes(self.generator.quotes)
+        self.assertEqual(json.loads(body.decode("utf-8")), self.test_quotes["quotes"])
+        self.assertEqual(self.generator.render_quotes([]), b"[]")
+
+    def test_render_text_matches_formatter(self):
+        """Test that text variants match format_quote."""
+        quote = self.generator.quotes[0]
+        self.assertEqual(
+            self.generator.render_quotes([quote], "text").decode("utf-8"),
+            format_quote(quote, no_color=True),
+        )
+        self.assertEqual(
+            self.generator.render_quotes([quote], "color").decode("utf-8"),
+            format_quote(quote, no_color=False),
+        )
+
+    def test_cache_hits_recorded(self):
+        """Test that repeated renders are served from the cache."""
+        self.generator.render_quotes(self.generator.quotes)
+        self.generator.render_quotes(self.generator.quotes)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+        self.assertEqual(self.metrics.snapshot()["caches"]["response_cache"]["hits"], 2)
+
+    def test_works_without_cache(self):
+        """Test rendering with no cache configured."""
+        generator = QuoteGenerator(self.temp_file.name)
+        self.assertEqual(json.loads(generator.render_quotes(generator.quotes)), self.test_quotes["quotes"])
+
+    def test_invalid_format(self):
+        """Test that an unknown format is rejected."""
+        with self.assertRaises(ValueError):
+            self.generator.render_quotes(self.generator.quotes, "xml")
+
+    def test_reload_invalidates(self):
+        """Test that reloading the corpus clears the cache."""
+        self.generator.render_quotes(self.generator.quotes)
+        self.generator.reload()
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
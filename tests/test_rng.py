@@ -0,0 +1,90 @@
+"""
+Unit tests for the rng module.
+"""
+
+import unittest
+import threading
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.rng import RandomSource, derive_seed
+
+
+class TestRandomSource(unittest.TestCase):
+    """Test cases for RandomSource."""
+
+    def test_derive_seed_deterministic(self):
+        """Test that derived seeds are stable and path-dependent."""
+        self.assertEqual(derive_seed(1, 2), derive_seed(1, 2))
+        self.assertNotEqual(derive_seed(1, 2), derive_seed(1, 3))
+        self.assertNotEqual(derive_seed(1, 2), derive_seed(2, 2))
+
+    def test_stream_per_thread(self):
+        """Test that each thread gets its own generator."""
+        source = RandomSource()
+        streams = []
+
+        def worker():
+            streams.append(source.get())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(stream) for stream in streams}), 4)
+        self.assertIs(source.get(), source.get())
+
+    def test_seeded_source_reproducible(self):
+        """Test that a seeded source reproduces its first stream."""
+        first = [RandomSource(seed=7).get().random() for _ in range(2)]
+        self.assertEqual(first[0], first[1])
+
+    def test_for_call_seed(self):
+        """Test that a per-call seed gives a fresh reproducible generator."""
+        source = RandomSource()
+        self.assertEqual(source.for_call(3).random(), source.for_call(3).random())
+        self.assertIs(source.for_call(None), source.get())
+
+    def test_split(self):
+        """Test that split children are independent and reproducible."""
+        children = RandomSource(seed=1).split(3)
+        values = [child.get().random() for child in children]
+        self.assertEqual(len(set(values)), 3)
+        again = [child.get().random() for child in RandomSource(seed=1).split(3)]
+        self.assertEqual(values, again)
+        self.assertEqual(len(RandomSource().split(2)), 2)
+
+
+class TestGeneratorSampling(unittest.TestCase):
+    """Test cases for seeded sampling through QuoteGenerator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.generator = QuoteGenerator()
+
+    def test_seeded_random_quote(self):
+        """Test that a per-call seed makes get_random_quote reproducible."""
+        self.assertIs(
+            self.generator.get_random_quote(seed=11),
+            self.generator.get_random_quote(seed=11),
+        )
+
+    def test_seeded_multiple_quotes(self):
+        """Test that a per-call seed makes get_multiple_quotes reproducible."""
+        self.assertEqual(
+            self.generator.get_multiple_quotes(5, seed=11),
+            self.generator.get_multiple_quotes(5, seed=11),
+        )
+
+    def test_injected_source(self):
+        """Test that generators sharing a seed draw the same sequence."""
+        first = QuoteGenerator(rng=RandomSource(seed=5))
+        second = QuoteGenerator(rng=RandomSource(seed=5))
+        self.assertEqual(
+            [first.get_random_quote() for _ in range(5)],
+            [second.get_random_quote() for _ in range(5)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
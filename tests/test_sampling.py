@@ -0,0 +1,184 @@
+"""
+Unit tests for sampling without replacement.
+"""
+
+import unittest
+import json
+import random
+import tempfile
+from array import array
+from collections import Counter
+from pathlib import Path
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.sampling import PositionGroups, SparseShuffle, stratified_sample
+
+
+class TestSparseShuffle(unittest.TestCase):
+    """Test cases for SparseShuffle."""
+
+    def test_permutation(self):
+        """Test that drawing everything yields each item once."""
+        items = array("I", [5, 0, 9, 3, 7, 1])
+        shuffle = SparseShuffle(items, random.Random(1))
+        drawn = [shuffle.draw() for _ in range(len(items))]
+        self.assertEqual(sorted(drawn), sorted(items))
+        self.assertEqual(len(shuffle), 0)
+        self.assertEqual(list(items), [5, 0, 9, 3, 7, 1])
+        with self.assertRaises(IndexError):
+            shuffle.draw()
+
+    def test_uniform_first_draw(self):
+        """Test that every item is equally likely to be drawn first."""
+        rng = random.Random(2)
+        counts = Counter(SparseShuffle(range(10), rng).draw() for _ in range(20000))
+        for item in range(10):
+            self.assertAlmostEqual(counts[item] / 20000, 0.1, delta=0.015)
+
+    def test_large_sequence_stays_sparse(self):
+        """Test that a few draws from a huge range record only a few swaps."""
+        shuffle = SparseShuffle(range(10 ** 9), random.Random(3))
+        drawn = {shuffle.draw() for _ in range(100)}
+        self.assertEqual(len(drawn), 100)
+        self.assertLessEqual(len(shuffle._swaps), 100)
+
+
+class TestStratifiedSample(unittest.TestCase):
+    """Test cases for stratified_sample."""
+
+    def setUp(self):
+        """Set up strata of very different sizes."""
+        self.strata = [range(0, 1000), range(1000, 1010), range(1010, 1012)]
+        self.rng = random.Random(4)
+
+    def stratum_counts(self, items):
+        """Number of items drawn from each stratum."""
+        return Counter(0 if i < 1000 else 1 if i < 1010 else 2 for i in items)
+
+    def test_balanced(self):
+        """Test that strata contribute equally while they last."""
+        items = stratified_sample(self.strata, 6, self.rng)
+        self.assertEqual(self.stratum_counts(items), {0: 2, 1: 2, 2: 2})
+
+    def test_exhausted_strata_redistribute(self):
+        """Test that quotas of exhausted strata go to the others."""
+        items = stratified_sample(self.strata, 30, self.rng)
+        self.assertEqual(len(set(items)), 30)
+        self.assertEqual(self.stratum_counts(items), {0: 18, 1: 10, 2: 2})
+
+    def test_remainder_spread(self):
+        """Test that counts differ by at most one."""
+        for count in range(1, 7):
+            counts = self.stratum_counts(stratified_sample(self.strata, count, self.rng))
+            self.assertEqual(sum(counts.values()), count)
+            self.assertLessEqual(max(counts.values()) - min(counts.values(), default=0), 1)
+
+    def test_group_cap(self):
+        """Test that no group exceeds the cap and nothing repeats."""
+        groups = PositionGroups()
+        for i in range(100):
+            groups.add(i % 7, i)
+        items = stratified_sample([groups], 50, self.rng, max_per_group=3)
+        self.assertEqual(len(items), 21)
+        self.assertEqual(len(set(items)), 21)
+        self.assertEqual(set(Counter(i % 7 for i in items).values()), {3})
+
+    def test_group_cap_shared_across_strata(self):
+        """Test that a key is capped over all strata together."""
+        strata = [PositionGroups(), PositionGroups()]
+        for i in range(40):
+            strata[i % 2].add(i % 4, i)
+        items = stratified_sample(strata, 40, self.rng, max_per_group=2)
+        self.assertEqual(set(Counter(i % 4 for i in items).values()), {2})
+
+    def test_group_cap_cost_independent_of_group_size(self):
+        """Test that a dominant capped group does not cause rejections."""
+        groups = PositionGroups()
+        for i in range(100000):
+            groups.add("big", i)
+        for key in range(20):
+            groups.add(key, 100000 + key)
+        calls = []
+
+        class CountingRandom(random.Random):
+            def randrange(self, *args, **kwargs):
+                calls.append(args)
+                return super().randrange(*args, **kwargs)
+
+        items = stratified_sample([groups], 21, CountingRandom(5), max_per_group=1)
+        self.assertEqual(len(items), 21)
+        self.assertEqual(sum(1 for i in items if i < 100000), 1)
+        self.assertLessEqual(len(calls), 2 * 21 + 1)
+
+    def test_exhausted(self):
+        """Test that fewer items are returned once every stratum runs out."""
+        self.assertEqual(len(stratified_sample(self.strata, 5000, self.rng)), 1012)
+        self.assertEqual(stratified_sample([], 5, self.rng), [])
+        self.assertEqual(stratified_sample(self.strata, 0, self.rng), [])
+
+
+class TestGeneratorSampling(unittest.TestCase):
+    """Test the sampling strategies of get_multiple_quotes."""
+
+    def setUp(self):
+        """Set up a collection dominated by one category and one author."""
+        quotes = [{"text": f"Big {i}", "author": "Prolific", "category": "big"} for i in range(90)]
+        quotes += [{"text": f"Small {i}", "author": f"Author {i % 5}", "category": "small"} for i in range(10)]
+        quotes += [{"text": "Tiny", "author": "Rare", "category": "tiny"}]
+        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+        json.dump({"quotes": quotes}, self.temp_file)
+        self.temp_file.close()
+        self.generator = QuoteGenerator(self.temp_file.name)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        Path(self.temp_file.name).unlink()
+
+    def test_stratified_balances_categories(self):
+        """Test that stratified batches spread over categories."""
+        quotes = self.generator.get_multiple_quotes(9, strategy="stratified", seed=1)
+        self.assertEqual(Counter(q["category"] for q in quotes), {"big": 4, "small": 4, "tiny": 1})
+
+    def test_max_per_author(self):
+        """Test that the author cap holds and quotes are distinct."""
+        quotes = self.generator.get_multiple_quotes(20, max_per_author=2, seed=2)
+        self.assertEqual(len(quotes), 13)
+        self.assertEqual(len({q["text"] for q in quotes}), 13)
+        self.assertLessEqual(max(Counter(q["author"] for q in quotes).values()), 2)
+
+    def test_author_cap_after_add_quote(self):
+        """Test that quotes added after the author index is built are capped too."""
+        self.generator.get_multiple_quotes(1, max_per_author=1, seed=4)
+        self.generator.add_quote({"text": "New", "author": "Newcomer", "category": "tiny"})
+        quotes = self.generator.get_multiple_quotes(10, category="tiny", max_per_author=1, seed=4)
+        self.assertEqual({q["author"] for q in quotes}, {"Rare", "Newcomer"})
+
+    def test_stratified_with_author_cap(self):
+        """Test combining both constraints."""
+        quotes = self.generator.get_multiple_quotes(6, strategy="stratified", max_per_author=1, seed=3)
+        self.assertEqual(len({q["author"] for q in quotes}), 6)
+        self.assertEqual(Counter(q["category"] for q in quotes)["big"], 1)
+
+    def test_category_filter(self):
+        """Test that a category filter limits the pool."""
+        quotes = self.generator.get_multiple_quotes(50, category="SMALL", strategy="stratified")
+        self.assertEqual(len(quotes), 10)
+        self.assertEqual({q["category"] for q in quotes}, {"small"})
+        self.assertEqual(self.generator.get_multiple_quotes(3, category="none", strategy="stratified"), [])
+
+    def test_seeded(self):
+        """Test that seeded calls are reproducible."""
+        self.assertEqual(
+            self.generator.get_multiple_quotes(5, strategy="stratified", seed=7),
+            self.generator.get_multiple_quotes(5, strategy="stratified", seed=7),
+        )
+
+    def test_invalid_arguments(self):
+        """Test that bad strategies and caps raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.generator.get_multiple_quotes(3, strategy="weighted")
+        with self.assertRaises(ValueError):
+            self.generator.get_multiple_quotes(3, max_per_author=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Unit tests for quote-of-the-day scheduling.
+"""
+
+import unittest
+import json
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.schedule import KeyedPermutation
+
+
+class TestKeyedPermutation(unittest.TestCase):
+    """Test cases for KeyedPermutation."""
+
+    def test_is_permutation(self):
+        """Test that every size yields a bijection on range(size)."""
+        for size in (1, 2, 3, 7, 16, 17, 100, 1000):
+            perm = KeyedPermutation(size, b"key")
+            self.assertEqual(sorted(perm[i] for i in range(size)), list(range(size)))
+
+    def test_key_changes_order(self):
+        """Test that different keys give different orders."""
+        first = [KeyedPermutation(50, b"a")[i] for i in range(50)]
+        second = [KeyedPermutation(50, b"b")[i] for i in range(50)]
+        self.assertNotEqual(first, second)
+
+    def test_deterministic(self):
+        """Test that the same key always gives the same order."""
+        self.assertEqual(
+            [KeyedPermutation(30, b"k")[i] for i in range(30)],
+            [KeyedPermutation(30, b"k")[i] for i in range(30)],
+        )
+
+    def test_invalid_arguments(self):
+        """Test size and index validation."""
+        with self.assertRaises(ValueError):
+            KeyedPermutation(0, b"k")
+        with self.assertRaises(IndexError):
+            KeyedPermutation(5, b"k")[5]
+
+
+class TestQuoteForDay(unittest.TestCase):
+    """Test cases for QuoteGenerator.quote_for and quote_calendar."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        quotes = [
+            {"text": f"Quote {i}", "author": f"Author {i % 3}",
+             "category": "even" if i % 2 == 0 else "odd"}
+            for i in range(10)
+        ]
+        self.temp_file = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.json'
+        )
+        json.dump({"quotes": quotes}, self.temp_file)
+        self.temp_file.close()
+
+        self.generator = QuoteGenerator(self.temp_file.name)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        Path(self.temp_file.name).unlink()
+
+    def _cycle_start(self, size):
+        """First day of a block of `size` days."""
+        ordinal = date(2026, 1, 1).toordinal()
+        return date.fromordinal(ordinal - ordinal % size)
+
+    def test_stable_for_day(self):
+        """Test that the same day and tenant always give the same quote."""
+        day = date(2026, 10, 19)
+        quote = self.generator.quote_for(day, "acme")
+        self.assertIs(self.generator.quote_for(day, "acme"), quote)
+        self.assertIs(self.generator.quote_for(datetime(2026, 10, 19, 23, 59), "acme"), quote)
+
+    def test_no_repeat_within_cycle(self):
+        """Test that every quote appears once before any repeats."""
+        start = self._cycle_start(10)
+        texts = [
+            self.generator.quote_for(start + timedelta(days=i), "acme")["text"]
+            for i in range(10)
+        ]
+        self.assertEqual(len(set(texts)), 10)
+
+    def test_category_filter(self):
+        """Test scheduling within a category pool."""
+        start = self._cycle_start(5)
+        quotes = [
+            self.generator.quote_for(start + timedelta(days=i), "acme", category="EVEN")
+            for i in range(5)
+        ]
+        self.assertTrue(all(q["category"] == "even" for q in quotes))
+        self.assertEqual(len({q["text"] for q in quotes}), 5)
+
+    def test_tenants_differ(self):
+        """Test that tenants get independent orderings."""
+        start = self._cycle_start(10)
+        orders = {
+            tenant: [
+                self.generator.quote_for(start + timedelta(days=i), tenant)["text"]
+                for i in range(10)
+            ]
+            for tenant in ("a", "b", "c")
+        }
+        self.assertGreater(len({tuple(order) for order in orders.values()}), 1)
+
+    def test_unknown_category(self):
+        """Test that an empty pool returns None."""
+        self.assertIsNone(self.generator.quote_for(date(2026, 1, 1), "acme", category="none"))
+
+    def test_calendar_matches_quote_for(self):
+        """Test that the bulk calendar matches per-day lookups."""
+        calendar = self.generator.quote_calendar(2024, ["a", "b"], category="odd")
+        self.assertEqual(len(calendar["a"]), 366)
+        for tenant, quotes in calendar.items():
+            for offset in (0, 1, 59, 200, 365):
+                day = date(2024, 1, 1) + timedelta(days=offset)
+                self.assertIs(quotes[offset], self.generator.quote_for(day, tenant, category="odd"))
+
+    def test_pinned_pool_size(self):
+        """Test that a pinned pool size keeps the schedule across add_quote."""
+        days = [date(2026, 10, 1) + timedelta(days=i) for i in range(30)]
+        before = [self.generator.quote_for(day, "acme", pool_size=10) for day in days]
+        self.generator.add_quote({"text": "Quote 10", "author": "Author 1", "category": "even"})
+        after = [self.generator.quote_for(day, "acme", pool_size=10) for day in days]
+        self.assertEqual(after, before)
+        self.assertNotEqual([self.generator.quote_for(day, "acme") for day in days], before)
+        calendar = self.generator.quote_calendar(2026, ["acme"], pool_size=10)["acme"]
+        offset = days[0].toordinal() - date(2026, 1, 1).toordinal()
+        self.assertEqual(calendar[offset:offset + 30], before)
+
+    def test_invalid_pool_size(self):
+        """Test pool_size validation."""
+        for pool_size in (0, 6):
+            with self.assertRaises(ValueError):
+                self.generator.quote_for(date(2026, 1, 1), "acme", category="odd", pool_size=pool_size)
+
+    def test_calendar_empty_pool(self):
+        """Test the calendar for a category with no quotes."""
+        self.assertEqual(self.generator.quote_calendar(2026, ["a"], category="none"), {"a": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Unit tests for seen-quote filters and exclusion-aware sampling.
+"""
+
+import unittest
+import json
+import tempfile
+from array import array
+from pathlib import Path
+from unittest import mock
+from quotes_generator.generator import QuoteGenerator
+from quotes_generator.seen import SeenBitset, SeenBloomFilter
+
+
+class TestSeenBitset(unittest.TestCase):
+    """Test cases for SeenBitset."""
+
+    def test_add_and_contains(self):
+        """Test membership and distinct counting."""
+        seen = SeenBitset([1, 9])
+        seen.add(9)
+        seen.add(1000)
+        self.assertEqual(len(seen), 3)
+        self.assertIn(1000, seen)
+        self.assertNotIn(2, seen)
+        self.assertNotIn(10 ** 6, seen)
+
+    def test_missing(self):
+        """Test both the range scan and the generic path."""
+        seen = SeenBitset(range(0, 30, 2))
+        self.assertEqual(seen.missing(range(5, 40)), list(range(5, 30, 2)) + list(range(30, 40)))
+        self.assertEqual(seen.missing(array("I", [4, 5, 6, 31])), [5, 31])
+        self.assertEqual(SeenBitset(range(64)).missing(range(64)), [])
+
+    def test_round_trip(self):
+        """Test serialization is compact and lossless."""
+        seen = SeenBitset([0, 3, 17])
+        data = seen.to_bytes()
+        self.assertEqual(len(data), 4)
+        restored = SeenBitset.from_bytes(data)
+        self.assertEqual(len(restored), 3)
+        self.assertEqual(restored.missing(range(20)), seen.missing(range(20)))
+        self.assertEqual(len(SeenBitset.from_bytes(SeenBitset().to_bytes())), 0)
+        with self.assertRaises(ValueError):
+            SeenBitset.from_bytes(SeenBloomFilter(10).to_bytes())
+
+
+class TestSeenBloomFilter(unittest.TestCase):
+    """Test cases for SeenBloomFilter."""
+
+    def test_no_false_negatives(self):
+        """Test that every added position is reported as seen."""
+        seen = SeenBloomFilter(capacity=1000)
+        for position in range(0, 3000, 3):
+            seen.add(position)
+        self.assertTrue(all(position in seen for position in range(0, 3000, 3)))
+
+    def test_error_rate(self):
+        """Test the false-positive rate at capacity is near the target."""
+        seen = SeenBloomFilter(capacity=5000, error_rate=0.01)
+        for position in range(5000):
+            seen.add(position)
+        false_positives = sum(position in seen for position in range(5000, 55000))
+        self.assertLess(false_positives / 50000, 0.02)
+        self.assertLess(len(seen.to_bytes()), 5000 * 1.3)
+
+    def test_round_trip(self):
+        """Test serialization keeps the filter intact."""
+        seen = SeenBloomFilter(capacity=100, error_rate=0.001)
+        for position in (5, 50, 500):
+            seen.add(position)
+        restored = SeenBloomFilter.from_bytes(seen.to_bytes())
+        self.assertEqual(len(restored), 3)
+        self.assertEqual(restored.num_hashes, seen.num_hashes)
+        self.assertEqual(restored.missing(range(600)), seen.missing(range(600)))
+        with self.assertRaises(ValueError):
+            SeenBloomFilter.from_bytes(seen.to_bytes()[:-1])
+        with self.assertRaises(ValueError):
+            SeenBloomFilter.from_bytes(SeenBitset([1]).to_bytes())
+
+    def test_invalid_arguments(self):
+        """Test that bad sizes raise ValueError."""
+        with self.assertRaises(ValueError):
+            SeenBloomFilter(capacity=0)
+        with self.assertRaises(ValueError):
+            SeenBloomFilter(capacity=10, error_rate=1.0)
+
+
+class TestExcludeSampling(unittest.TestCase):
+    """Test get_random_quote with an exclusion filter."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        quotes = [
+            {"text": f"Quote {i}", "author": f"Author {i}", "category": "even" if i % 2 == 0 else "odd"}
+            for i in range(40)
+        ]
+        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+        json.dump({"quotes": quotes}, self.temp_file)
+        self.temp_file.close()
+        self.generator = QuoteGenerator(self.temp_file.name)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        Path(self.temp_file.name).unlink()
+
+    def test_never_repeats(self):
+        """Test that marking seen quotes walks the collection without repeats."""
+        for seen in (SeenBitset(), SeenBloomFilter(capacity=1000, error_rate=0.0001)):
+            texts = [self.generator.get_random_quote(exclude=seen, mark_seen=True)["text"] for _ in range(40)]
+            self.assertEqual(len(set(texts)), 40)
+            self.assertIsNone(self.generator.get_random_quote(exclude=seen))
+
+    def test_few_unseen_left(self):
+        """Test that the last unseen quote is found when rejection would fail."""
+        seen = SeenBitset(idx for idx in range(40) if idx != 17)
+        for seed in range(20):
+            self.assertEqual(self.generator.get_random_quote(exclude=seen, seed=seed)["text"], "Quote 17")
+        self.assertEqual(len(seen), 39)
+
+    def test_bloom_filter_scan_avoided(self):
+        """Test that a filling Bloom filter gets more picks before a full scan."""
+        seen = SeenBloomFilter(capacity=1000, error_rate=0.0001)
+        for idx in range(30):
+            seen.add(idx)
+        with mock.patch.object(SeenBloomFilter, "missing", side_effect=AssertionError("scanned")):
+            for seed in range(20):
+                quote = self.generator.get_random_quote(exclude=seen, seed=seed)
+                self.assertGreaterEqual(int(quote["text"].split()[1]), 30)
+
+    def test_category(self):
+        """Test exclusion within a category."""
+        seen = SeenBitset(range(0, 38, 2))
+        quote = self.generator.get_random_quote(category="EVEN", exclude=seen, mark_seen=True)
+        self.assertEqual(quote["text"], "Quote 38")
+        self.assertIsNone(self.generator.get_random_quote(category="even", exclude=seen))
+        self.assertIsNone(self.generator.get_random_quote(category="none", exclude=seen))
+        self.assertEqual(self.generator.get_random_quote(category="odd", exclude=seen)["category"], "odd")
+
+    def test_seeded(self):
+        """Test that seeded calls are reproducible."""
+        seen = SeenBitset(range(10))
+        self.assertEqual(
+            self.generator.get_random_quote(exclude=seen, seed=3),
+            self.generator.get_random_quote(exclude=seen, seed=3),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()